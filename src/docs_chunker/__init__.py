@@ -5,11 +5,9 @@ __all__ = ["__version__"]
 
 __version__ = "0.1.0"
 
-# Configure logging
-logging.basicConfig(
-    level=logging.WARNING,  # Default: only warnings and errors
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# Library logging: leave handler/format configuration to the application
+# (the CLI configures it when it runs)
+logging.getLogger("docs_chunker").addHandler(logging.NullHandler())
 
 # Allow debug logging via environment variable
 if os.getenv("DOCS_CHUNKER_DEBUG"):
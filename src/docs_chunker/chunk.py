@@ -1,405 +1,560 @@
 from __future__ import annotations
 
+import io
+import os
 import re
-from collections.abc import Sequence
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import accumulate, compress, islice, pairwise, repeat
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .llm_strategy import ChunkingStrategy
     from .structure import DocumentStructure
 
+__all__ = [
+    "HEADING_RE",
+    "Chunk",
+    "chunk_by_strategy",
+    "chunk_markdown",
+    "chunk_markdown_batch",
+    "chunk_markdown_iter",
+    "estimate_tokens",
+    "estimate_tokens_batch",
+]
 
-@dataclass
+
+@dataclass(slots=True)
 class Chunk:
     id: int
     title: str
     level: int
     content: str
+    # Computed once from ``content`` so merge/split passes don't re-tokenize
+    token_count: int = field(default=0, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self.token_count:
+            self.token_count = estimate_tokens(self.content)
 
 
 HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+# Code block delimiters: an opening fence may name a language
+CODE_BLOCK_OPEN_RE = re.compile(r"^```[a-zA-Z0-9_-]*$")
+CODE_BLOCK_CLOSE_RE = re.compile(r"^```\s*$")
+# Line prefixes that can open a heading or a code fence
+_SCAN_PREFIXES = ("#", "```")
 PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+# Paragraph breaks other than a plain "\n\n": three or more newlines, or
+# whitespace between two newlines
+_WIDE_PARAGRAPH_BREAK_RE = re.compile(r"\n[^\S\n]*\n[^\S\n]*\n|\n[^\S\n]+\n")
+# Line boundaries recognized by str.splitlines
+_LINE_BREAK_RE = re.compile("\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+# Number of leading lines considered when extracting a title
+_TITLE_SCAN_LINES = 10
+# Split points for oversized chunks without subheadings:
+# numbered list items (1., 2., ...) and bold headings (**text**). They are
+# scanned separately: one alternation would let a match consume the start of
+# the other kind's next match (e.g. "1. \n  **b**")
+NUMBERED_ITEM_RE = re.compile(r"^\s*\d+\.\s+", re.MULTILINE)
+BOLD_RE = re.compile(r"^\s*\*\*[^*]+\*\*", re.MULTILINE)
+
+
+@lru_cache(maxsize=8)
+def _get_encoder(model: str) -> Any | None:
+    """Return a cached tiktoken encoder for ``model`` or ``None`` if unavailable.
+
+    Failures (missing package, unknown model, offline BPE download) are cached
+    as well, so the heuristic fallback doesn't retry the lookup on every call.
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.encoding_for_model(model)
+    except ImportError:
+        return None
+    except Exception:
+        # If tiktoken fails for any reason (e.g., unknown model), fall back
+        return None
 
 
-def estimate_tokens(text: str, model: str = "gpt-4") -> int:
+def estimate_tokens(
+    text: str, model: str = "gpt-4", upper_bound: int | None = None
+) -> int:
     """
     Estimate token count for text using tiktoken if available, otherwise use heuristic.
 
+    Results are memoized per ``(text, model)``: the chunking pipeline re-estimates
+    the same chunk contents repeatedly while merging and splitting.
+
     Args:
         text: Text to estimate tokens for
         model: Model name for tiktoken encoding (default: "gpt-4")
+        upper_bound: Optional limit the caller compares against. When the text
+            provably can't exceed it (every token covers at least one UTF-8
+            byte), the char-based heuristic is returned without encoding. Only
+            pass this when the result is used for a threshold check.
 
     Returns:
         Estimated token count (always at least 1)
     """
-    try:
-        import tiktoken
-
-        enc = tiktoken.encoding_for_model(model)
-        return max(1, len(enc.encode(text)))
-    except ImportError:
-        # Fallback heuristic: ~1 token per 4 chars (safe lower-bound)
-        # Ensures Hebrew/RTL text remains counted by length
-        return max(1, len(text) // 4)
-    except Exception:
-        # If tiktoken fails for any reason (e.g., unknown model), fall back
+    if (
+        upper_bound is not None
+        and len(text) <= upper_bound
+        and len(text.encode("utf-8")) <= upper_bound
+    ):
         return max(1, len(text) // 4)
+    return _count_tokens(text, model)
 
 
-def _find_headings(lines: list[str]) -> list[tuple[int, int, str]]:
-    # Regex patterns for code block delimiters
-    code_block_open_re = re.compile(r"^```[a-zA-Z0-9_-]*$")
-    code_block_close_re = re.compile(r"^```\s*$")
+@lru_cache(maxsize=4096)
+def _count_tokens(text: str, model: str) -> int:
+    enc = _get_encoder(model)
+    if enc is not None:
+        try:
+            return max(1, len(enc.encode_ordinary(text)))
+        except Exception:
+            pass
+    # Fallback heuristic: ~1 token per 4 chars (safe lower-bound)
+    # Ensures Hebrew/RTL text remains counted by length
+    return max(1, len(text) // 4)
+
 
+def estimate_tokens_batch(texts: Sequence[str], model: str = "gpt-4") -> list[int]:
+    """
+    Estimate token counts for many texts at once.
+
+    With tiktoken available the texts are encoded in a single
+    ``encode_ordinary_batch`` call, which tokenizes them in parallel threads;
+    otherwise each text goes through ``estimate_tokens``.
+
+    Args:
+        texts: Texts to estimate tokens for
+        model: Model name for tiktoken encoding (default: "gpt-4")
+
+    Returns:
+        Estimated token counts in the same order as ``texts`` (each at least 1)
+    """
+    enc = _get_encoder(model)
+    if enc is not None and texts:
+        try:
+            return [max(1, len(t)) for t in enc.encode_ordinary_batch(list(texts))]
+        except Exception:
+            pass
+    return [estimate_tokens(text, model) for text in texts]
+
+
+def _line_offsets(lines: Sequence[str]) -> list[int]:
+    """Return the start offset of each line plus the total length.
+
+    ``lines`` must come from ``text.splitlines(keepends=True)`` so that
+    ``text[offsets[start]:offsets[end]]`` equals ``"".join(lines[start:end])``.
+    """
+    return [0, *accumulate(map(len, lines))]
+
+
+def _parse_heading(line: str) -> tuple[int, str] | None:
+    """Return ``(level, title)`` if ``line`` is an ATX heading, else ``None``.
+
+    Hand-rolled equivalent of ``HEADING_RE.match`` that avoids the regex
+    engine on the hot line-scanning paths.
+    """
+    if not line.startswith("#"):
+        return None
+    body = line.lstrip("#")
+    level = len(line) - len(body)
+    if level > 6 or not body[:1].isspace():
+        return None
+    return level, body.strip()
+
+
+def _find_headings(lines: list[str]) -> list[tuple[int, int, str]]:
     heads: list[tuple[int, int, str]] = []
     in_code_block = False
 
-    for idx, line in enumerate(lines):
-        # Strip line ending for delimiter detection, but keep original
-        # for heading matching
-        line_stripped = line.rstrip("\r\n")
-
-        # Check if this line is a code block delimiter
-        if code_block_open_re.match(line_stripped):
-            in_code_block = True
-            continue
-        elif code_block_close_re.match(line_stripped):
-            in_code_block = False
-            continue
+    # Only fence and heading lines can change the result; select them with a
+    # C-level map so prose lines never reach the Python loop body
+    candidates = compress(
+        range(len(lines)), map(str.startswith, lines, repeat(_SCAN_PREFIXES))
+    )
+    for idx in candidates:
+        line = lines[idx]
+        if line.startswith("```"):
+            # Strip line ending for delimiter detection
+            line_stripped = line.rstrip("\r\n")
+
+            # Check if this line is a code block delimiter
+            if CODE_BLOCK_OPEN_RE.match(line_stripped):
+                in_code_block = True
+                continue
+            elif CODE_BLOCK_CLOSE_RE.match(line_stripped):
+                in_code_block = False
+                continue
 
         # Only check for headings when not inside a code block
         if not in_code_block:
-            m = HEADING_RE.match(line)
-            if m:
-                level = len(m.group(1))
-                title = m.group(2).strip()
-                heads.append((idx, level, title))
+            heading = _parse_heading(line)
+            if heading:
+                heads.append((idx, *heading))
     return heads
 
 
 def _extract_title_from_content(content: str, fallback: str = "") -> str:
     """Extract title from content's first heading or use fallback."""
-    lines = content.splitlines()
+    if content.startswith("#"):
+        # Fast path: heading-led content takes its title from the first line
+        line_break = _LINE_BREAK_RE.search(content)
+        heading = _parse_heading(
+            content[: line_break.start()] if line_break else content
+        )
+        if heading:
+            return heading[1]
+    # Only the first lines matter, so bound the work by the head of the content
+    breaks = list(islice(_LINE_BREAK_RE.finditer(content), _TITLE_SCAN_LINES))
+    if len(breaks) == _TITLE_SCAN_LINES:
+        content = content[: breaks[-1].end()]
+    return _extract_title_from_head(content, fallback)
+
+
+@lru_cache(maxsize=1024)
+def _extract_title_from_head(head: str, fallback: str) -> str:
+    lines = head.splitlines()
     for line in lines[:5]:  # Check first few lines
-        m = HEADING_RE.match(line)
-        if m:
-            return m.group(2).strip()
+        heading = _parse_heading(line)
+        if heading:
+            return heading[1]
     # Fallback: use first non-empty line if it's short
-    for line in lines[:10]:
+    for line in lines[:_TITLE_SCAN_LINES]:
         stripped = line.strip()
         if stripped and len(stripped) < 100 and not stripped.startswith("#"):
             return stripped[:80]
     return fallback or "Untitled"
 
 
+def _split_paragraphs(content: str) -> list[tuple[str, str]]:
+    """Split ``content`` into ``(paragraph_text, separator_after)`` pairs.
+
+    Separators are the exact ``PARAGRAPH_BREAK_RE`` matches, so joining the
+    pairs reproduces ``content``. Returns an empty list when there are no
+    paragraph breaks.
+    """
+    if "\n\n" in content and not _WIDE_PARAGRAPH_BREAK_RE.search(content):
+        # Fast path: every break is exactly "\n\n", so str.split finds the
+        # same separators as the regex
+        parts = content.split("\n\n")
+        pairs = [(part, "\n\n") for part in parts[:-1]]
+        # Add the last paragraph (after the last break)
+        if parts[-1]:
+            pairs.append((parts[-1], ""))
+        return pairs
+
+    # Find all paragraph breaks with their exact positions and content
+    pairs = []
+    last_end = 0
+    for match in PARAGRAPH_BREAK_RE.finditer(content):
+        # Extract paragraph text (from last break to current break) and the
+        # exact separator (the matched whitespace/newlines)
+        pairs.append((content[last_end : match.start()], match.group(0)))
+        last_end = match.end()
+
+    # Add the last paragraph (after the last break)
+    if pairs and last_end < len(content):
+        pairs.append((content[last_end:], ""))
+    return pairs
+
+
 def _split_oversized_chunk(
     chunk: Chunk, max_tokens: int, max_depth: int = 10, current_depth: int = 0
 ) -> list[Chunk]:
     """
     Split a chunk that exceeds max_tokens by paragraphs or subheadings.
 
+    Parts that are still oversized are pushed back onto a work stack and split
+    again, up to ``max_depth`` levels, after which they are split by character
+    count. Token counts travel with each part, so fitting parts are emitted
+    without being re-estimated.
+
     Args:
         chunk: Chunk to split
         max_tokens: Maximum tokens per chunk
-        max_depth: Maximum recursion depth to prevent infinite loops (default: 10)
-        current_depth: Current recursion depth (default: 0)
+        max_depth: Maximum split depth to prevent infinite loops (default: 10)
+        current_depth: Depth of ``chunk`` itself (default: 0)
 
     Returns:
         List of Chunk objects
+    """
+    result: list[Chunk] = []
+    # (chunk, depth, separator to append to its last part, needs splitting)
+    work: list[tuple[Chunk, int, str, bool]] = [(chunk, current_depth, "", True)]
+    while work:
+        item, depth, suffix, needs_split = work.pop()
+        parts = (
+            _split_once(item, max_tokens, depth >= max_depth) if needs_split else None
+        )
+        if parts is None:
+            if suffix:
+                item = Chunk(
+                    id=item.id,
+                    title=item.title,
+                    level=item.level,
+                    content=item.content + suffix,
+                )
+            result.append(item)
+            continue
+        # Push in reverse so parts are emitted in document order; the last
+        # part carries this item's separator after its own
+        last = len(parts) - 1
+        for idx in range(last, -1, -1):
+            part, oversized, separator = parts[idx]
+            if idx == last:
+                separator += suffix
+            work.append((part, depth + 1, separator, oversized))
+    return result
+
+
+def _split_once(
+    chunk: Chunk, max_tokens: int, depth_exceeded: bool
+) -> list[tuple[Chunk, bool, str]] | None:
+    """
+    Split ``chunk`` one level deeper.
 
-    Raises:
-        RuntimeError: If max_depth is exceeded (indicates content that can't be split)
+    Returns ``(part, oversized, separator_after)`` entries, where oversized parts
+    still need splitting and ``separator_after`` is appended to the part's last
+    piece. Returns ``None`` when the chunk should be kept as-is.
     """
-    # Prevent infinite recursion on edge cases
-    if current_depth >= max_depth:
+    # Prevent endless splitting on edge cases
+    if depth_exceeded:
         # Fallback: split by character count to ensure progress
-        target_size = max_tokens * 4  # chars
-        if len(chunk.content) <= target_size:
-            return [chunk]
-        # Force split by approximate char count
-        parts = []
-        for i in range(0, len(chunk.content), target_size):
-            parts.append(chunk.content[i : i + target_size])
-        split_chunks = []
-        for idx, part in enumerate(parts):
-            title = chunk.title if idx == 0 else f"{chunk.title} (part {idx + 1})"
-            split_chunks.append(
-                Chunk(id=chunk.id, title=title, level=chunk.level, content=part)
-            )
-        return split_chunks
+        return _split_by_chars(chunk, max_tokens)
 
     content = chunk.content
-    tokens = estimate_tokens(content)
-    if tokens <= max_tokens:
-        return [chunk]
+    if chunk.token_count <= max_tokens:
+        return None
 
     lines = content.splitlines(keepends=True)
+    offsets = _line_offsets(lines)
     # Try splitting by subheadings first (deeper level than current)
     subheadings = []
     for idx, line in enumerate(lines):
-        m = HEADING_RE.match(line)
-        if m and len(m.group(1)) > chunk.level:
-            subheadings.append((idx, len(m.group(1)), m.group(2).strip()))
+        heading = _parse_heading(line)
+        if heading and heading[0] > chunk.level:
+            subheadings.append((idx, *heading))
 
     if subheadings:
         # Split by subheadings
-        parts: list[tuple[int, int, str]] = []
-        for i, (sub_idx, sub_level, sub_title) in enumerate(subheadings):
+        ranges: list[tuple[int, int, str]] = []
+        for i, (sub_idx, _sub_level, _sub_title) in enumerate(subheadings):
             start = subheadings[i - 1][0] if i > 0 else 0
             end = sub_idx
             if start < end:
-                parts.append(
+                ranges.append(
                     (start, end, subheadings[i - 1][2] if i > 0 else chunk.title)
                 )
         # Add last part
-        if subheadings:
-            last_start = subheadings[-1][0]
-            parts.append((last_start, len(lines), subheadings[-1][2]))
-
-        split_chunks: list[Chunk] = []
-        for start, end, part_title in parts:
-            part_content = "".join(lines[start:end])
-            if estimate_tokens(part_content) > max_tokens:
-                # Recursively split this part
-                temp_chunk = Chunk(
-                    id=chunk.id,
-                    title=part_title,
-                    level=chunk.level + 1,
-                    content=part_content,
-                )
-                split_chunks.extend(
-                    _split_oversized_chunk(
-                        temp_chunk, max_tokens, max_depth, current_depth + 1
-                    )
-                )
-            else:
-                split_chunks.append(
-                    Chunk(
-                        id=chunk.id,
-                        title=part_title,
-                        level=chunk.level + 1,
-                        content=part_content,
-                    )
-                )
-        return split_chunks
+        last_start = subheadings[-1][0]
+        ranges.append((last_start, len(lines), subheadings[-1][2]))
+
+        parts: list[tuple[Chunk, bool, str]] = []
+        for start, end, part_title in ranges:
+            part_chunk = Chunk(
+                id=chunk.id,
+                title=part_title,
+                level=chunk.level + 1,
+                content=content[offsets[start] : offsets[end]],
+            )
+            parts.append((part_chunk, part_chunk.token_count > max_tokens, ""))
+        return parts
 
     # No subheadings: try to split by numbered list items or bold headings first
     # Look for numbered list patterns (1., 2., etc.) or bold text (**text**)
-    numbered_item_re = re.compile(r"^\s*\d+\.\s+", re.MULTILINE)
-    bold_re = re.compile(r"^\s*\*\*[^*]+\*\*", re.MULTILINE)
-
-    # Find potential split points
-    split_points: list[int] = [0]
-    for match in numbered_item_re.finditer(content):
-        if match.start() > 0:
-            split_points.append(match.start())
-    for match in bold_re.finditer(content):
-        if match.start() > 0 and match.start() not in split_points:
-            split_points.append(match.start())
-    split_points = sorted(set(split_points))
+    # Find potential split points, sorted and unique
+    split_points = sorted(
+        {
+            0,
+            *(m.start() for m in NUMBERED_ITEM_RE.finditer(content)),
+            *(m.start() for m in BOLD_RE.finditer(content)),
+        }
+    )
     split_points.append(len(content))
 
     # If we found split points, use them
     if len(split_points) > 2:
-        split_chunks: list[Chunk] = []
-        for i in range(len(split_points) - 1):
-            start = split_points[i]
-            end = split_points[i + 1]
-            part_content = content[start:end]
-            part_tokens = estimate_tokens(part_content)
-
-            if part_tokens > max_tokens:
-                # Recursively split this part
-                part_title = _extract_title_from_content(part_content, chunk.title)
-                temp_chunk = Chunk(
-                    id=chunk.id,
-                    title=part_title,
-                    level=chunk.level,
-                    content=part_content,
-                )
-                split_chunks.extend(
-                    _split_oversized_chunk(
-                        temp_chunk, max_tokens, max_depth, current_depth + 1
-                    )
-                )
-            else:
-                part_title = _extract_title_from_content(part_content, chunk.title)
-                split_chunks.append(
-                    Chunk(
-                        id=chunk.id,
-                        title=part_title,
-                        level=chunk.level,
-                        content=part_content,
-                    )
-                )
-
-        return split_chunks if split_chunks else [chunk]
-
-    # Fallback: split by paragraphs, preserving exact whitespace
-    # Find all paragraph breaks with their exact positions and content
-    para_breaks = list(PARAGRAPH_BREAK_RE.finditer(content))
-    if len(para_breaks) == 0:
-        # Single paragraph or no clear breaks: split by approximate size
-        target_size = max_tokens * 4  # chars
-        if len(content) <= target_size:
-            return [chunk]
-        # Split by approximate char count
         parts = []
-        for i in range(0, len(content), target_size):
-            parts.append(content[i : i + target_size])
-        split_chunks = []
-        for idx, part in enumerate(parts):
-            title = chunk.title if idx == 0 else f"{chunk.title} (part {idx + 1})"
-            split_chunks.append(
-                Chunk(id=chunk.id, title=title, level=chunk.level, content=part)
+        for i in range(len(split_points) - 1):
+            part_content = content[split_points[i] : split_points[i + 1]]
+            part_chunk = Chunk(
+                id=chunk.id,
+                title=_extract_title_from_content(part_content, chunk.title),
+                level=chunk.level,
+                content=part_content,
             )
-        return split_chunks
+            parts.append((part_chunk, part_chunk.token_count > max_tokens, ""))
+        return parts
 
-    # Extract paragraphs with their original separators preserved
+    # Fallback: split by paragraphs, preserving exact whitespace
     # Each element is (paragraph_text, separator_after)
-    paragraphs_with_seps: list[tuple[str, str]] = []
-    last_end = 0
-
-    for match in para_breaks:
-        # Extract paragraph text (from last break to current break)
-        para_text = content[last_end : match.start()]
-        # Extract the exact separator (the matched whitespace/newlines)
-        separator = match.group(0)
-        paragraphs_with_seps.append((para_text, separator))
-        last_end = match.end()
-
-    # Add the last paragraph (after the last break)
-    if last_end < len(content):
-        paragraphs_with_seps.append((content[last_end:], ""))
+    paragraphs_with_seps = _split_paragraphs(content)
+    if not paragraphs_with_seps:
+        # Single paragraph or no clear breaks: split by approximate size
+        return _split_by_chars(chunk, max_tokens)
 
     # Split by paragraphs, grouping to stay under max_tokens
     # Preserve original separators when joining
-    split_chunks: list[Chunk] = []
-    current_group: list[tuple[str, str]] = []  # (text, separator_after)
+    parts = []
+    # Paragraphs of the group in progress, written with their separators
+    current_group = io.StringIO()
     current_tokens = 0
 
-    for para_text, separator in paragraphs_with_seps:
-        para_tokens = estimate_tokens(para_text)
+    def flush_group() -> None:
+        nonlocal current_group
+        group_content = current_group.getvalue()
+        current_group = io.StringIO()
+        title = _extract_title_from_content(group_content, chunk.title)
+        group_chunk = Chunk(
+            id=chunk.id, title=title, level=chunk.level, content=group_content
+        )
+        parts.append((group_chunk, False, ""))
+
+    para_token_counts = estimate_tokens_batch([p for p, _ in paragraphs_with_seps])
+    for (para_text, separator), para_tokens in zip(
+        paragraphs_with_seps, para_token_counts
+    ):
         # If a single paragraph exceeds max_tokens, split it
         if para_tokens > max_tokens:
             # Finish current group first
-            if current_group:
-                # Reconstruct with original separators
-                group_parts = []
-                for p_text, p_sep in current_group:
-                    group_parts.append(p_text)
-                    if p_sep:
-                        group_parts.append(p_sep)
-                group_content = "".join(group_parts)
-                title = _extract_title_from_content(group_content, chunk.title)
-                split_chunks.append(
-                    Chunk(
-                        id=chunk.id,
-                        title=title,
-                        level=chunk.level,
-                        content=group_content,
-                    )
-                )
-                current_group = []
+            if current_group.tell():
+                flush_group()
                 current_tokens = 0
-            # Split the oversized paragraph
+            # Split the oversized paragraph; its separator goes after the
+            # last piece of the split result
             part_title = _extract_title_from_content(para_text, chunk.title)
-            temp_chunk = Chunk(
-                id=chunk.id, title=part_title, level=chunk.level, content=para_text
-            )
-            split_parts = _split_oversized_chunk(
-                temp_chunk, max_tokens, max_depth, current_depth + 1
+            para_chunk = Chunk(
+                id=chunk.id,
+                title=part_title,
+                level=chunk.level,
+                content=para_text,
+                token_count=para_tokens,
             )
-            # Preserve the separator after the oversized paragraph by appending it
-            # to the last chunk of the split result
-            if split_parts and separator:
-                split_parts[-1] = Chunk(
-                    id=split_parts[-1].id,
-                    title=split_parts[-1].title,
-                    level=split_parts[-1].level,
-                    content=split_parts[-1].content + separator,
-                )
-            split_chunks.extend(split_parts)
-        elif current_tokens + para_tokens > max_tokens and current_group:
+            parts.append((para_chunk, True, separator))
+        elif current_tokens + para_tokens > max_tokens and current_group.tell():
             # Finish current group
-            group_parts = []
-            for p_text, p_sep in current_group:
-                group_parts.append(p_text)
-                if p_sep:
-                    group_parts.append(p_sep)
-            group_content = "".join(group_parts)
-            title = _extract_title_from_content(group_content, chunk.title)
-            split_chunks.append(
-                Chunk(
-                    id=chunk.id, title=title, level=chunk.level, content=group_content
-                )
-            )
-            current_group = [(para_text, separator)]
+            flush_group()
+            current_group.write(para_text)
+            current_group.write(separator)
             current_tokens = para_tokens
         else:
-            current_group.append((para_text, separator))
+            current_group.write(para_text)
+            current_group.write(separator)
             current_tokens += para_tokens
 
     # Add remaining
-    if current_group:
-        group_parts = []
-        for p_text, p_sep in current_group:
-            group_parts.append(p_text)
-            if p_sep:
-                group_parts.append(p_sep)
-        group_content = "".join(group_parts)
-        title = _extract_title_from_content(group_content, chunk.title)
-        split_chunks.append(
-            Chunk(id=chunk.id, title=title, level=chunk.level, content=group_content)
-        )
+    if current_group.tell():
+        flush_group()
 
-    return split_chunks if split_chunks else [chunk]
+    return parts
 
 
-def _normalize_chunks(
-    chunks: Sequence[Chunk], min_tokens: int, max_tokens: int
-) -> list[Chunk]:
-    """Merge undersized chunks and split oversized ones.
+def _split_by_chars(
+    chunk: Chunk, max_tokens: int
+) -> list[tuple[Chunk, bool, str]] | None:
+    """Split ``chunk`` into pieces of roughly ``max_tokens * 4`` characters."""
+    target_size = max_tokens * 4  # chars
+    content = chunk.content
+    if len(content) <= target_size:
+        return None
+    parts = []
+    for idx, i in enumerate(range(0, len(content), target_size)):
+        title = chunk.title if idx == 0 else f"{chunk.title} (part {idx + 1})"
+        part = Chunk(
+            id=chunk.id,
+            title=title,
+            level=chunk.level,
+            content=content[i : i + target_size],
+        )
+        parts.append((part, False, ""))
+    return parts
 
-    This mirrors the logic used by ``chunk_markdown`` so that alternative chunk
-    generation paths (e.g., LLM strategies) can reuse the same token
-    constraints and guarantees around coverage preservation.
-    """
 
-    merged: list[Chunk] = []
+def _iter_merged(chunks: Iterable[Chunk | None], min_tokens: int) -> Iterator[Chunk]:
+    """Merge each undersized chunk with the one that follows it.
+
+    Only a single pending chunk is held at a time.
+    """
+    pending: Chunk | None = None
     for ch in chunks:
         if ch is None:
             continue
-        if merged and estimate_tokens(merged[-1].content) < min_tokens:
-            prev = merged.pop()
-            combined = Chunk(
-                id=prev.id,
-                title=prev.title or ch.title,
-                level=min(prev.level, ch.level),
-                content=prev.content + ch.content,
-            )
-            merged.append(combined)
+        if pending is None:
+            pending = ch
+        elif pending.token_count < min_tokens:
+            # Grow the pending chunk in place rather than allocating a new one
+            additive = _counts_add_up(pending.content, ch.content)
+            pending.content += ch.content
+            if additive:
+                pending.token_count += ch.token_count
+            else:
+                pending.token_count = estimate_tokens(pending.content)
+            if not pending.title:
+                pending.title = ch.title
+            pending.level = min(pending.level, ch.level)
         else:
-            merged.append(ch)
+            yield pending
+            pending = ch
+    if pending is not None:
+        yield pending
+
+
+def _counts_add_up(left: str, right: str) -> bool:
+    """Whether ``left + right`` has as many tokens as both parts together.
 
-    final: list[Chunk] = []
-    for ch in merged:
-        if estimate_tokens(ch.content) > max_tokens:
-            final.extend(_split_oversized_chunk(ch, max_tokens))
+    tiktoken always starts a new pre-token at a heading line that follows a
+    newline, so the encodings concatenate. The length heuristic isn't additive.
+    """
+    return (
+        right.startswith("#")
+        and left.endswith(("\n", "\r"))
+        and _get_encoder("gpt-4") is not None
+    )
+
+
+def _iter_split(chunks: Iterable[Chunk], max_tokens: int) -> Iterator[Chunk]:
+    """Split oversized chunks and fill in missing titles."""
+    for ch in chunks:
+        if ch.token_count > max_tokens:
+            yield from _split_oversized_chunk(ch, max_tokens)
         else:
             if not ch.title:
                 ch.title = _extract_title_from_content(ch.content)
-            final.append(ch)
+            yield ch
+
 
-    for i, ch in enumerate(final, start=1):
+def _iter_normalized(
+    chunks: Iterable[Chunk | None], min_tokens: int, max_tokens: int
+) -> Iterator[Chunk]:
+    for i, ch in enumerate(
+        _iter_split(_iter_merged(chunks, min_tokens), max_tokens), start=1
+    ):
         ch.id = i
+        yield ch
 
-    return final
+
+def _normalize_chunks(
+    chunks: Iterable[Chunk | None], min_tokens: int, max_tokens: int
+) -> list[Chunk]:
+    """Merge undersized chunks and split oversized ones.
+
+    This mirrors the logic used by ``chunk_markdown`` so that alternative chunk
+    generation paths (e.g., LLM strategies) can reuse the same token
+    constraints and guarantees around coverage preservation.
+    """
+    return list(_iter_normalized(chunks, min_tokens, max_tokens))
 
 
 def _make_chunk_from_range(
-    lines: Sequence[str],
+    markdown_text: str,
+    offsets: Sequence[int],
     structure: DocumentStructure | None,
     start: int,
     end: int,
@@ -407,7 +562,7 @@ def _make_chunk_from_range(
     if start >= end:
         return None
 
-    content = "".join(lines[start:end])
+    content = markdown_text[offsets[start] : offsets[end]]
     if not content:
         return None
 
@@ -442,8 +597,8 @@ def _chunk_by_level(
     if level < 1 or level > 6:
         raise ValueError(f"Invalid heading level: {level}")
 
-    lines_keepends = markdown_text.splitlines(keepends=True)
-    total_lines = len(lines_keepends)
+    offsets = _line_offsets(markdown_text.splitlines(keepends=True))
+    total_lines = len(offsets) - 1
 
     boundaries: set[int] = {0, total_lines}
     for heading in structure.headings:
@@ -453,7 +608,7 @@ def _chunk_by_level(
     ordered = sorted(boundaries)
     raw_chunks: list[Chunk] = []
     for start, end in zip(ordered, ordered[1:]):
-        chunk = _make_chunk_from_range(lines_keepends, structure, start, end)
+        chunk = _make_chunk_from_range(markdown_text, offsets, structure, start, end)
         if chunk is not None:
             raw_chunks.append(chunk)
 
@@ -467,8 +622,8 @@ def _chunk_by_boundaries(
     min_tokens: int,
     max_tokens: int,
 ) -> list[Chunk]:
-    lines_keepends = markdown_text.splitlines(keepends=True)
-    total_lines = len(lines_keepends)
+    offsets = _line_offsets(markdown_text.splitlines(keepends=True))
+    total_lines = len(offsets) - 1
 
     valid_boundaries = {
         b for b in boundaries if isinstance(b, int) and 0 <= b <= total_lines
@@ -479,7 +634,7 @@ def _chunk_by_boundaries(
 
     raw_chunks: list[Chunk] = []
     for start, end in zip(ordered, ordered[1:]):
-        chunk = _make_chunk_from_range(lines_keepends, structure, start, end)
+        chunk = _make_chunk_from_range(markdown_text, offsets, structure, start, end)
         if chunk is not None:
             raw_chunks.append(chunk)
 
@@ -577,38 +732,116 @@ def chunk_markdown(
     Raises:
         ValueError: If min_tokens < 1 or max_tokens < min_tokens
     """
+    return list(chunk_markdown_iter(markdown_text, min_tokens, max_tokens))
+
+
+def chunk_markdown_batch(
+    texts: Sequence[str],
+    min_tokens: int = 200,
+    max_tokens: int = 1200,
+    *,
+    workers: int | None = None,
+) -> list[list[Chunk]]:
+    """
+    Chunk several documents with ``chunk_markdown``, in parallel processes.
+
+    Documents are independent, so they are spread over up to ``workers``
+    processes (default: one per CPU). Each worker loads the tokenizer once and
+    receives documents in batches to keep inter-process traffic low. With a
+    single document or worker everything runs in the calling process.
+
+    Args:
+        texts: Markdown texts to chunk
+        min_tokens: Minimum tokens per chunk (must be >= 1)
+        max_tokens: Maximum tokens per chunk (must be >= min_tokens)
+        workers: Maximum number of worker processes
+
+    Returns:
+        The chunks of each document, in the order of ``texts``
+
+    Raises:
+        ValueError: If min_tokens < 1 or max_tokens < min_tokens
+    """
+    _check_token_limits(min_tokens, max_tokens)
+    run = partial(chunk_markdown, min_tokens=min_tokens, max_tokens=max_tokens)
+    worker_count = min(len(texts), workers or os.cpu_count() or 1)
+    if worker_count <= 1:
+        return [run(text) for text in texts]
+    with ProcessPoolExecutor(
+        max_workers=worker_count, initializer=_init_chunk_worker
+    ) as executor:
+        return list(
+            executor.map(run, texts, chunksize=max(1, len(texts) // (4 * worker_count)))
+        )
+
+
+def _init_chunk_worker() -> None:
+    # Load the tokenizer up front instead of in the first document's chunking
+    _get_encoder("gpt-4")
+
+
+def chunk_markdown_iter(
+    markdown_text: str, min_tokens: int = 200, max_tokens: int = 1200
+) -> Iterator[Chunk]:
+    """
+    Lazily chunk markdown text; see ``chunk_markdown``.
+
+    Chunks are produced one at a time through the boundary, merge and split
+    stages, so only the pending chunk is held in memory rather than the
+    intermediate lists. Arguments are validated eagerly.
+
+    Raises:
+        ValueError: If min_tokens < 1 or max_tokens < min_tokens
+    """
+    _check_token_limits(min_tokens, max_tokens)
+    return _iter_markdown_chunks(markdown_text, min_tokens, max_tokens)
+
+
+def _check_token_limits(min_tokens: int, max_tokens: int) -> None:
     if min_tokens < 1:
         raise ValueError(f"min_tokens must be >= 1, got {min_tokens}")
     if max_tokens < min_tokens:
         raise ValueError(
             f"max_tokens ({max_tokens}) must be >= min_tokens ({min_tokens})"
         )
+
+
+def _iter_markdown_chunks(
+    markdown_text: str, min_tokens: int, max_tokens: int
+) -> Iterator[Chunk]:
     lines = markdown_text.splitlines(keepends=True)
     headings = _find_headings(lines)
 
     if not headings:
         # No headings: split by size if needed
-        if estimate_tokens(markdown_text) > max_tokens:
-            chunks = _split_oversized_chunk(
-                Chunk(
-                    id=1,
-                    title=_extract_title_from_content(markdown_text),
-                    level=0,
-                    content=markdown_text,
-                ),
-                max_tokens,
-            )
-            for i, ch in enumerate(chunks, start=1):
+        whole = Chunk(
+            id=1,
+            title=_extract_title_from_content(markdown_text),
+            level=0,
+            content=markdown_text,
+        )
+        if whole.token_count > max_tokens:
+            for i, ch in enumerate(_split_oversized_chunk(whole, max_tokens), start=1):
                 ch.id = i
-            return chunks
-        return [
-            Chunk(
-                id=1,
-                title=_extract_title_from_content(markdown_text),
-                level=0,
-                content=markdown_text,
-            )
-        ]
+                yield ch
+        else:
+            yield whole
+        return
+
+    raw_chunks = _iter_boundary_chunks(markdown_text, lines, headings)
+    yield from _iter_normalized(raw_chunks, min_tokens, max_tokens)
+
+
+# Sections whose token counts ``_iter_boundary_chunks`` requests at once
+_COUNT_WINDOW = 64
+
+
+def _iter_boundary_chunks(
+    markdown_text: str,
+    lines: Sequence[str],
+    headings: Sequence[tuple[int, int, str]],
+) -> Iterator[Chunk]:
+    offsets = _line_offsets(lines)
 
     # Choose a base level that partitions the document
     # (one level deeper than the minimum if possible)
@@ -618,11 +851,9 @@ def chunk_markdown(
 
     # Boundaries are all headings with level <= base_level, starting from the first line
     boundaries: list[int] = [0]
-    titles_levels: list[tuple[str, int]] = []
-    for idx, level, title in headings:
+    for idx, level, _title in headings:
         if level <= base_level:
             boundaries.append(idx)
-            titles_levels.append((title, level))
 
     # Ensure unique, sorted boundaries and include document end
     boundaries = sorted(set(boundaries))
@@ -633,29 +864,41 @@ def chunk_markdown(
 
     # Build chunks between consecutive boundaries;
     # title/level from the heading at the start boundary if present
-    chunks: list[Chunk] = []
-    for i in range(len(boundaries) - 1):
-        start = boundaries[i]
-        end = boundaries[i + 1]
+    spans = list(pairwise(boundaries))
+    contents: list[str] = []
+    counts: list[int] = []
+    prev: Chunk | None = None
+    for i, (start, end) in enumerate(spans):
+        if i % _COUNT_WINDOW == 0:
+            # Tokenize a window of sections per batch call; bounded, so the
+            # generator never holds more than a window of contents
+            contents = [
+                markdown_text[offsets[a] : offsets[b]]
+                for a, b in spans[i : i + _COUNT_WINDOW]
+            ]
+            counts = estimate_tokens_batch(contents)
         # Find heading at start
-        m = HEADING_RE.match(lines[start]) if start < len(lines) else None
-        if m:
-            title = m.group(2).strip()
-            level = len(m.group(1))
+        heading = _parse_heading(lines[start]) if start < len(lines) else None
+        if heading:
+            level, title = heading
         else:
             # Use previous heading's title/level if exists;
             # otherwise extract from content
-            if chunks:
-                title = chunks[-1].title
-                level = chunks[-1].level
+            if prev is not None:
+                title = prev.title
+                level = prev.level
             else:
                 # Extract from first lines of content
-                content_preview = "".join(lines[start : min(start + 10, end)])
+                content_preview = markdown_text[
+                    offsets[start] : offsets[min(start + 10, end)]
+                ]
                 title = _extract_title_from_content(content_preview)
                 level = 0
-        content = "".join(lines[start:end])
-        chunks.append(
-            Chunk(id=len(chunks) + 1, title=title, level=level, content=content)
+        prev = Chunk(
+            id=i + 1,
+            title=title,
+            level=level,
+            content=contents[i % _COUNT_WINDOW],
+            token_count=counts[i % _COUNT_WINDOW],
         )
-
-    return _normalize_chunks(chunks, min_tokens, max_tokens)
+        yield prev
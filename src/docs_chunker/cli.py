@@ -1,20 +1,61 @@
 import logging
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 import typer
 from rich import print
 
-from . import llm
 from .chunk import chunk_markdown
 from .config import settings
-from .convert import convert_docx_to_markdown
-from .io import doc_name_from_path, output_paths_for, write_text
+from .io import (
+    conversion_cache_dir,
+    doc_name_from_path,
+    iter_docx,
+    llm_cache_dir,
+    output_paths_for,
+    write_text,
+)
 from .writer import save_chunks
 
 logger = logging.getLogger(__name__)
 
 app = typer.Typer(help="Docs Chunker CLI")
 
+# Converted documents the serial pipeline may hold ahead of chunking
+_PIPELINE_DEPTH = 4
+
+
+@dataclass(frozen=True)
+class _ConvertOptions:
+    """Resolved per-run options, picklable for worker processes."""
+
+    force: bool
+    dry_run: bool
+    min_tokens: int
+    max_tokens: int
+    llm_strategy: bool
+    llm_validate: bool
+    provider: str
+    model: str
+    base_url: str | None
+    api_key: str | None
+    language: str
+    cache_dir: Path | None
+    llm_cache: bool
+    llm_cache_dir: Path | None
+
+
+def _configure_logging() -> None:
+    """Send warnings (and debug output, if enabled) to stderr for CLI runs."""
+    logging.basicConfig(
+        level=logging.WARNING,  # Default: only warnings and errors
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
 
 @app.command()
 def convert(
@@ -49,8 +90,28 @@ def convert(
         None,
         help="API key for OpenAI provider (overrides environment).",
     ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse cached DOCX conversions for unchanged files.",
+    ),
+    llm_cache: bool | None = typer.Option(
+        None,
+        "--llm-cache/--no-llm-cache",
+        help="Reuse cached LLM strategies and proposals for unchanged documents.",
+    ),
+    workers: int | None = typer.Option(
+        None,
+        min=1,
+        help=(
+            "Worker processes for directory batches "
+            "(default: CPU count, or 1 with LLM stages)."
+        ),
+    ),
 ) -> None:
     """Convert DOCX files to Markdown and chunk them for RAG systems."""
+    _configure_logging()
+
     # Validate token parameters
     if min_tokens < 1:
         print(f"[red]Error:[/red] min_tokens must be >= 1, got {min_tokens}")
@@ -75,6 +136,7 @@ def convert(
     effective_llm_validate = (
         settings.llm_validation_enabled if llm_validate is None else llm_validate
     )
+    effective_llm_cache = settings.llm_cache_enabled if llm_cache is None else llm_cache
     provider_value = (llm_provider or settings.llm_provider).lower()
     model_value = llm_model or (
         settings.local_model if provider_value == "local" else settings.openai_model
@@ -87,7 +149,7 @@ def convert(
     # Collect targets
     targets = []
     if input_path.is_dir():
-        targets = list(input_path.glob("*.docx"))
+        targets = list(iter_docx(input_path))
         if not targets:
             print(f"[yellow]Warning:[/yellow] No .docx files found in {input_path}")
             return
@@ -102,154 +164,274 @@ def convert(
         print(f"[red]Error:[/red] Path is neither a file nor a directory: {input_path}")
         raise typer.Exit(code=1)
 
-    # Process each target
-    for target in targets:
-        try:
-            base_dir, chunks_dir = output_paths_for(target)
-            full_md_path = base_dir / f"{doc_name_from_path(target)}.md"
-            if full_md_path.exists() and not force:
-                print(f"[yellow]Skip existing:[/yellow] {full_md_path}")
-                continue
+    opts = _ConvertOptions(
+        force=force,
+        dry_run=dry_run,
+        min_tokens=min_tokens,
+        max_tokens=max_tokens,
+        llm_strategy=effective_llm_strategy,
+        llm_validate=effective_llm_validate,
+        provider=provider_value,
+        model=model_value,
+        base_url=base_url_value,
+        api_key=api_key_value,
+        language=settings.language,
+        cache_dir=conversion_cache_dir() if cache else None,
+        llm_cache=effective_llm_cache,
+        llm_cache_dir=llm_cache_dir() if effective_llm_cache else None,
+    )
+    # LLM stages stay sequential unless --workers asks otherwise, so a batch does
+    # not send one request per CPU at the model server at once
+    default_workers = 1 if opts.llm_strategy or opts.llm_validate else os.cpu_count()
+    worker_count = min(len(targets), workers or default_workers or 1)
 
-            # Convert DOCX to Markdown
+    # Process each target; files are independent, so batches run in parallel
+    if len(targets) == 1:
+        _print_messages(_process_one(targets[0], opts))
+        return
+    if worker_count <= 1:
+        _run_pipelined(targets, opts)
+        return
+
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        futures = [executor.submit(_process_one, target, opts) for target in targets]
+        # Print in target order so the output does not depend on scheduling
+        for target, future in zip(targets, futures):
             try:
-                md_text = convert_docx_to_markdown(target)
-            except FileNotFoundError:
-                print(f"[red]Error:[/red] File not found: {target}")
-                continue
-            except RuntimeError as e:
-                print(f"[red]Error:[/red] Conversion failed for {target}: {e}")
-                continue
+                messages = future.result()
             except Exception as e:
-                print(f"[red]Error:[/red] Unexpected error converting {target}: {e}")
-                continue
+                messages = [
+                    f"[red]Error:[/red] Unexpected error processing {target}: {e}"
+                ]
+            _print_messages(messages)
+
 
-            # Write full markdown
+def _run_pipelined(targets: list[Path], opts: _ConvertOptions) -> None:
+    """Process ``targets`` in one process, converting ahead of chunking.
+
+    A producer thread converts documents and writes their full Markdown while
+    the calling thread chunks and saves the previous ones. The bounded queue
+    keeps at most a few converted documents in memory.
+    """
+    pending: queue.Queue[tuple[Path, list[str], str | None] | None] = queue.Queue(
+        maxsize=_PIPELINE_DEPTH
+    )
+
+    def produce() -> None:
+        for target in targets:
+            messages: list[str] = []
+            md_text = None
             try:
-                write_text(full_md_path, md_text)
-                print(f"[green]Wrote:[/green] {full_md_path}")
-            except PermissionError:
-                print(f"[red]Error:[/red] Permission denied writing to {full_md_path}")
-                continue
+                md_text = _convert_stage(target, opts, messages)
             except Exception as e:
-                print(f"[red]Error:[/red] Failed to write {full_md_path}: {e}")
-                continue
+                messages.append(
+                    f"[red]Error:[/red] Unexpected error processing {target}: {e}"
+                )
+            pending.put((target, messages, md_text))
+        pending.put(None)
 
-            chunks = None
-            strategy_info = None
+    producer = threading.Thread(target=produce, name="docs-chunker-convert")
+    producer.daemon = True
+    producer.start()
+    while (item := pending.get()) is not None:
+        target, messages, md_text = item
+        if md_text is not None:
+            try:
+                _chunk_stage(target, md_text, opts, messages)
+            except Exception as e:
+                messages.append(
+                    f"[red]Error:[/red] Unexpected error processing {target}: {e}"
+                )
+        _print_messages(messages)
+    producer.join()
 
-            if effective_llm_strategy:
-                try:
-                    logger.debug(
-                        f"Attempting LLM strategy selection with "
-                        f"provider '{provider_value}'"
-                    )
-                    strategy_chunks, _, strategy_info = llm.chunk_with_llm_strategy(
-                        md_text,
-                        min_tokens,
-                        max_tokens,
-                        provider=provider_value,
-                        model=model_value,
-                        base_url=base_url_value,
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"LLM strategy selection failed for {target}: {e}",
-                        exc_info=True,
-                    )
-                    print(
-                        "[yellow]Warning:[/yellow] LLM strategy selection failed; "
-                        f"falling back to heuristics: {e}"
-                    )
-                    strategy_chunks = None
-                if strategy_chunks:
-                    chunks = strategy_chunks
-                    strategy_label = ""
-                    if strategy_info:
-                        if (
-                            strategy_info.strategy_type == "by_level"
-                            and strategy_info.level is not None
-                        ):
-                            strategy_label = f"level {strategy_info.level} headings"
-                        elif (
-                            strategy_info.strategy_type == "custom_boundaries"
-                            and strategy_info.boundaries is not None
-                        ):
-                            strategy_label = (
-                                "custom boundaries "
-                                f"({len(strategy_info.boundaries)} markers)"
-                            )
-                        if strategy_info.reasoning:
-                            strategy_label = (
-                                f"{strategy_label} – {strategy_info.reasoning}"
-                                if strategy_label
-                                else strategy_info.reasoning
-                            )
-                    print(
-                        "[cyan]LLM strategy:[/cyan] applied"
-                        + (f" {strategy_label}" if strategy_label else "")
-                    )
-                elif strategy_info is not None:
-                    print(
-                        "[yellow]Warning:[/yellow] LLM provided a strategy that could "
-                        "not be applied; using heuristic chunking"
-                    )
 
-            if chunks is None:
-                try:
-                    chunks = chunk_markdown(
-                        md_text, min_tokens=min_tokens, max_tokens=max_tokens
-                    )
-                except ValueError as e:
-                    print(f"[red]Error:[/red] Chunking failed for {target}: {e}")
-                    continue
-
-            if effective_llm_validate:
-                try:
-                    logger.debug(
-                        f"Attempting LLM validation with provider '{provider_value}'"
-                    )
-                    adjusted_chunks = llm.validate_and_adjust_chunks(
-                        md_text,
-                        chunks,
-                        min_tokens,
-                        max_tokens,
-                        language_hint=settings.language,
-                        provider=provider_value,
-                        model=model_value,
-                        base_url=base_url_value,
-                        api_key=api_key_value,
-                    )
-                    chunks = adjusted_chunks
-                    print(
-                        "[cyan]LLM validation:[/cyan] using provider "
-                        f"'{provider_value}'"
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"LLM validation failed for {target}: {e}",
-                        exc_info=True,
+def _print_messages(messages: list[str]) -> None:
+    for message in messages:
+        print(message)
+
+
+def _process_one(target: Path, opts: _ConvertOptions) -> list[str]:
+    """Convert, chunk and save a single DOCX file.
+
+    Runs in a worker process for multi-file batches, so console output is
+    returned as a list of rich-markup messages for the parent to print.
+    """
+    messages: list[str] = []
+    try:
+        md_text = _convert_stage(target, opts, messages)
+        if md_text is not None:
+            _chunk_stage(target, md_text, opts, messages)
+    except Exception as e:
+        messages.append(f"[red]Error:[/red] Unexpected error processing {target}: {e}")
+    return messages
+
+
+def _convert_stage(
+    target: Path, opts: _ConvertOptions, messages: list[str]
+) -> str | None:
+    """Convert ``target`` and write its full Markdown.
+
+    Returns the Markdown text, or ``None`` if the file was skipped or failed
+    (the reason is appended to ``messages``).
+    """
+    base_dir, chunks_dir = output_paths_for(target)
+    full_md_path = base_dir / f"{doc_name_from_path(target)}.md"
+    if full_md_path.exists() and not opts.force:
+        messages.append(f"[yellow]Skip existing:[/yellow] {full_md_path}")
+        return None
+
+    # Convert DOCX to Markdown; markitdown is imported on first use so
+    # --help and argument errors don't pay for it
+    from .convert import convert_docx_to_markdown
+
+    try:
+        md_text = convert_docx_to_markdown(target, cache_dir=opts.cache_dir)
+    except FileNotFoundError:
+        messages.append(f"[red]Error:[/red] File not found: {target}")
+        return None
+    except RuntimeError as e:
+        messages.append(f"[red]Error:[/red] Conversion failed for {target}: {e}")
+        return None
+    except Exception as e:
+        messages.append(f"[red]Error:[/red] Unexpected error converting {target}: {e}")
+        return None
+
+    # Write full markdown
+    try:
+        write_text(full_md_path, md_text)
+        messages.append(f"[green]Wrote:[/green] {full_md_path}")
+    except PermissionError:
+        messages.append(
+            f"[red]Error:[/red] Permission denied writing to {full_md_path}"
+        )
+        return None
+    except Exception as e:
+        messages.append(f"[red]Error:[/red] Failed to write {full_md_path}: {e}")
+        return None
+    return md_text
+
+
+def _chunk_stage(
+    target: Path, md_text: str, opts: _ConvertOptions, messages: list[str]
+) -> None:
+    """Chunk converted Markdown and save (or report) the chunk files."""
+    chunks = None
+    strategy_info = None
+
+    if opts.llm_strategy:
+        try:
+            from . import llm  # Deferred: only LLM runs pay for the providers
+
+            logger.debug(
+                f"Attempting LLM strategy selection with " f"provider '{opts.provider}'"
+            )
+            strategy_chunks, _, strategy_info = llm.chunk_with_llm_strategy(
+                md_text,
+                opts.min_tokens,
+                opts.max_tokens,
+                provider=opts.provider,
+                model=opts.model,
+                base_url=opts.base_url,
+                cache_dir=opts.llm_cache_dir,
+            )
+        except Exception as e:
+            logger.warning(
+                f"LLM strategy selection failed for {target}: {e}",
+                exc_info=True,
+            )
+            messages.append(
+                "[yellow]Warning:[/yellow] LLM strategy selection failed; "
+                f"falling back to heuristics: {e}"
+            )
+            strategy_chunks = None
+        if strategy_chunks:
+            chunks = strategy_chunks
+            strategy_label = ""
+            if strategy_info:
+                if (
+                    strategy_info.strategy_type == "by_level"
+                    and strategy_info.level is not None
+                ):
+                    strategy_label = f"level {strategy_info.level} headings"
+                elif (
+                    strategy_info.strategy_type == "custom_boundaries"
+                    and strategy_info.boundaries is not None
+                ):
+                    strategy_label = (
+                        "custom boundaries "
+                        f"({len(strategy_info.boundaries)} markers)"
                     )
-                    print(
-                        "[yellow]Warning:[/yellow] LLM validation failed, "
-                        f"using heuristic chunks: {e}"
+                if strategy_info.reasoning:
+                    strategy_label = (
+                        f"{strategy_label} – {strategy_info.reasoning}"
+                        if strategy_label
+                        else strategy_info.reasoning
                     )
+            messages.append(
+                "[cyan]LLM strategy:[/cyan] applied"
+                + (f" {strategy_label}" if strategy_label else "")
+            )
+        elif strategy_info is not None:
+            messages.append(
+                "[yellow]Warning:[/yellow] LLM provided a strategy that could "
+                "not be applied; using heuristic chunking"
+            )
 
-            if dry_run:
-                print(
-                    f"[cyan]Dry-run:[/cyan] would write {len(chunks)} chunks "
-                    f"for {target.name}"
-                )
-            else:
-                try:
-                    save_chunks(target, chunks)
-                    print(f"[green]Chunks:[/green] wrote {len(chunks)} files")
-                except Exception as e:
-                    print(f"[red]Error:[/red] Failed to save chunks for {target}: {e}")
-                    continue
+    if chunks is None:
+        try:
+            chunks = chunk_markdown(
+                md_text, min_tokens=opts.min_tokens, max_tokens=opts.max_tokens
+            )
+        except ValueError as e:
+            messages.append(f"[red]Error:[/red] Chunking failed for {target}: {e}")
+            return
+
+    if opts.llm_validate:
+        try:
+            from . import llm
+
+            logger.debug(f"Attempting LLM validation with provider '{opts.provider}'")
+            adjusted_chunks = llm.validate_and_adjust_chunks(
+                md_text,
+                chunks,
+                opts.min_tokens,
+                opts.max_tokens,
+                language_hint=opts.language,
+                provider=opts.provider,
+                model=opts.model,
+                base_url=opts.base_url,
+                api_key=opts.api_key,
+                cache=opts.llm_cache,
+                cache_dir=opts.llm_cache_dir,
+            )
+            chunks = adjusted_chunks
+            messages.append(
+                "[cyan]LLM validation:[/cyan] using provider " f"'{opts.provider}'"
+            )
         except Exception as e:
-            print(f"[red]Error:[/red] Unexpected error processing {target}: {e}")
-            continue
+            logger.warning(
+                f"LLM validation failed for {target}: {e}",
+                exc_info=True,
+            )
+            messages.append(
+                "[yellow]Warning:[/yellow] LLM validation failed, "
+                f"using heuristic chunks: {e}"
+            )
+
+    if opts.dry_run:
+        messages.append(
+            f"[cyan]Dry-run:[/cyan] would write {len(chunks)} chunks "
+            f"for {target.name}"
+        )
+    else:
+        try:
+            save_chunks(target, chunks)
+            messages.append(f"[green]Chunks:[/green] wrote {len(chunks)} files")
+        except Exception as e:
+            messages.append(
+                f"[red]Error:[/red] Failed to save chunks for {target}: {e}"
+            )
 
 
 def main() -> None:
@@ -1,10 +1,13 @@
 import os
+from dataclasses import dataclass
 from typing import Literal
 
-from pydantic import BaseModel
+_LANGUAGES = frozenset({"auto", "en", "he"})
+_LLM_PROVIDERS = frozenset({"local", "openai"})
 
 
-class Settings(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Settings:
     documents_dir: str = "documents"
     output_dir: str = "output"
     language: Literal["auto", "en", "he"] = "auto"
@@ -17,6 +20,18 @@ class Settings(BaseModel):
     openai_model: str = "gpt-4o-mini"
     llm_validation_enabled: bool = False
     llm_strategy_enabled: bool = False
+    llm_cache_enabled: bool = True
+
+    def __post_init__(self) -> None:
+        if self.language not in _LANGUAGES:
+            raise ValueError(
+                f"language must be one of {sorted(_LANGUAGES)}, got {self.language!r}"
+            )
+        if self.llm_provider not in _LLM_PROVIDERS:
+            raise ValueError(
+                f"llm_provider must be one of {sorted(_LLM_PROVIDERS)}, "
+                f"got {self.llm_provider!r}"
+            )
 
     @classmethod
     def from_env(cls) -> "Settings":
@@ -71,6 +86,10 @@ class Settings(BaseModel):
                 os.getenv("DOCS_CHUNKER_LLM_STRATEGY", "false").lower()
                 in {"1", "true", "yes", "on"}
             ),
+            llm_cache_enabled=(
+                os.getenv("DOCS_CHUNKER_LLM_CACHE", "true").lower()
+                in {"1", "true", "yes", "on"}
+            ),
         )
 
 
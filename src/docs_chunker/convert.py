@@ -1,18 +1,28 @@
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
 
+from .io import checksum, file_checksum, store_cache_entry
+
 try:
     # Lazy import; in tests we can mock this interface
     from markitdown import MarkItDown  # type: ignore
 except Exception:  # pragma: no cover - optional at test-time
     MarkItDown = None  # type: ignore
 
+# Bump when the normalization below changes so cached conversions are redone
+_CACHE_FORMAT_VERSION = 1
+
 
-def convert_docx_to_markdown(input_path: Path) -> str:
+def convert_docx_to_markdown(input_path: Path, cache_dir: Path | None = None) -> str:
     """
     Convert a DOCX file to Markdown format.
 
     Args:
         input_path: Path to the DOCX file to convert
+        cache_dir: Optional directory for cached conversions. Entries are keyed
+            by a content hash of the file bytes plus the converter and its version,
+            so unchanged documents skip the markitdown pipeline on re-runs.
 
     Returns:
         Markdown content as a string
@@ -39,16 +49,63 @@ def convert_docx_to_markdown(input_path: Path) -> str:
             f"Expected .docx file, got: {input_path.suffix}. " f"File: {input_path}"
         )
 
+    cache_path = _cache_path_for(input_path, cache_dir) if cache_dir else None
+    if cache_path is not None:
+        try:
+            return cache_path.read_text(encoding="utf-8")
+        except OSError:
+            pass  # Cache miss (or unreadable entry): convert below
+
     try:
-        md = MarkItDown()
+        md = _get_markitdown(MarkItDown)
         result = md.convert(input_path.as_posix())
         if result is None:
             raise RuntimeError(f"Conversion returned None for file: {input_path}")
-        text = result.text_content or ""
-        # Basic normalization: unify line endings, strip trailing spaces
-        lines = [line.rstrip() for line in text.replace("\r\n", "\n").split("\n")]
-        return "\n".join(lines).strip() + "\n"
+        markdown = _normalize_markdown(result.text_content or "")
     except Exception as e:
         if isinstance(e, FileNotFoundError | RuntimeError | ValueError):
             raise
         raise RuntimeError(f"Failed to convert {input_path} to Markdown: {e}") from e
+
+    if cache_path is not None:
+        store_cache_entry(cache_path, markdown)
+    return markdown
+
+
+def _normalize_markdown(text: str) -> str:
+    """Unify line endings and strip trailing whitespace from every line."""
+    # str.rstrip per line runs in C and beats a trailing-whitespace regex
+    # (which is retried at every interior space) on typical prose
+    # Kept on str rather than bytes: bytes.rstrip only knows ASCII whitespace
+    # and would leave e.g. trailing NBSPs, for no measurable speedup
+    lines = text.replace("\r\n", "\n").split("\n")
+    return "\n".join(map(str.rstrip, lines)).strip() + "\n"
+
+
+@lru_cache(maxsize=1)
+def _get_markitdown(converter_cls: type["MarkItDown"]) -> "MarkItDown":
+    """Return a shared converter instance, built once per process.
+
+    Keyed on the class so replacing ``MarkItDown`` (as tests do) takes effect.
+    """
+    return converter_cls()
+
+
+def _cache_path_for(input_path: Path, cache_dir: Path) -> Path | None:
+    """Return the cache entry path for ``input_path`` or ``None`` if unreadable."""
+    try:
+        file_hash = file_checksum(input_path)
+    except OSError:
+        return None
+
+    converter = f"{MarkItDown.__module__}.{MarkItDown.__qualname__}"
+    identity = f"{converter}:{_markitdown_version()}:{_CACHE_FORMAT_VERSION}"
+    return cache_dir / f"{checksum(f'{identity}:{file_hash}')}.md"
+
+
+@lru_cache(maxsize=1)
+def _markitdown_version() -> str:
+    try:
+        return metadata.version("markitdown")
+    except metadata.PackageNotFoundError:
+        return "unknown"
@@ -1,4 +1,9 @@
 import hashlib
+import os
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from .config import settings
@@ -56,10 +61,58 @@ def doc_name_from_path(input_path: Path) -> str:
     return input_path.stem
 
 
+def iter_docx(root: Path) -> Iterator[Path]:
+    """
+    Yield the ``.docx`` files directly inside ``root``.
+
+    Uses ``os.scandir`` so file-type checks come from the directory entries
+    instead of a ``stat`` per path. Matches ``root.glob("*.docx")``: the suffix
+    check is case-sensitive and symlinked files are included.
+
+    Args:
+        root: Directory to scan
+
+    Raises:
+        OSError: If the directory can't be read
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name.endswith(".docx") and entry.is_file():
+                yield Path(entry.path)
+
+
+def remove_files(root: Path, suffix: str) -> None:
+    """
+    Delete the non-directory entries directly inside ``root`` ending in ``suffix``.
+
+    Like ``iter_docx`` this works from ``os.scandir`` entries, so no ``Path``
+    or ``stat`` is needed per file. A missing ``root`` counts as already empty.
+
+    Args:
+        root: Directory to clean
+        suffix: Case-sensitive name suffix, e.g. ``".md"``
+
+    Raises:
+        OSError: If the directory can't be read or a file can't be removed
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and not entry.is_dir(
+                    follow_symlinks=False
+                ):
+                    os.unlink(entry.path)
+    except FileNotFoundError:
+        pass
+
+
 def output_paths_for(input_path: Path) -> tuple[Path, Path]:
     """
     Generate output paths for a document, using path hash to prevent collisions.
 
+    Results are memoized per input path, output directory and working
+    directory, since the CLI and writer look up the same document repeatedly.
+
     Args:
         input_path: Path to the input document
 
@@ -69,6 +122,13 @@ def output_paths_for(input_path: Path) -> tuple[Path, Path]:
     Raises:
         ValueError: If path is invalid or contains traversal components
     """
+    return _output_paths_for(input_path, settings.output_dir, Path.cwd())
+
+
+@lru_cache(maxsize=1024)
+def _output_paths_for(
+    input_path: Path, output_dir: str, cwd: Path
+) -> tuple[Path, Path]:
     # Normalize the input path to absolute and resolve symlinks
     # Note: We don't require the file to exist here, as it might be created later
     try:
@@ -83,15 +143,29 @@ def output_paths_for(input_path: Path) -> tuple[Path, Path]:
     # Combine stem with hash: {stem}_{hash}
     name = f"{input_path.stem}_{path_hash}"
 
-    # Use absolute path if settings.output_dir is absolute, otherwise relative to cwd
-    output_base = Path(settings.output_dir)
-    if not output_base.is_absolute():
-        output_base = Path.cwd() / output_base
-    base_dir = output_base / name
+    base_dir = _output_base(output_dir, cwd) / name
     chunks_dir = base_dir / "chunks"
     return base_dir, chunks_dir
 
 
+def conversion_cache_dir() -> Path:
+    """Directory holding cached DOCX→Markdown conversions."""
+    return _output_base(settings.output_dir, Path.cwd()) / ".cache" / "convert"
+
+
+def llm_cache_dir() -> Path:
+    """Directory holding cached LLM boundary proposals."""
+    return _output_base(settings.output_dir, Path.cwd()) / ".cache" / "llm"
+
+
+def _output_base(output_dir: str, cwd: Path) -> Path:
+    # Use absolute path if output_dir is absolute, otherwise relative to cwd
+    output_base = Path(output_dir)
+    if not output_base.is_absolute():
+        output_base = cwd / output_base
+    return output_base
+
+
 def write_text(path: Path, content: str) -> None:
     """
     Write text content to a file, creating parent directories if needed.
@@ -105,13 +179,103 @@ def write_text(path: Path, content: str) -> None:
         OSError: If write fails
     """
     ensure_dir(path.parent)
+    _write_file(path, content)
+
+
+def write_texts(items: Sequence[tuple[Path, str]], max_workers: int = 8) -> None:
+    """
+    Write several text files concurrently, creating parent directories once.
+
+    File I/O releases the GIL, so a small thread pool overlaps the
+    open/write/close latency of many small files.
+
+    Args:
+        items: ``(path, content)`` pairs to write
+        max_workers: Maximum number of writer threads (default: 8)
+
+    Raises:
+        PermissionError: If permission denied (first failing item)
+        OSError: If a write fails (first failing item)
+    """
+    for parent in {path.parent for path, _ in items}:
+        ensure_dir(parent)
+
+    if len(items) <= 1:
+        for path, content in items:
+            _write_file(path, content)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [
+            executor.submit(_write_file, path, content) for path, content in items
+        ]
+    # Re-raise the first failure in submission order
+    for future in futures:
+        future.result()
+
+
+# O_BINARY keeps Windows from translating "\n" so output matches its checksum
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_file(path: Path, content: str) -> None:
     try:
-        path.write_text(content, encoding="utf-8")
+        # One raw open/write/close; skips the TextIOWrapper layer per small file
+        data = memoryview(content.encode("utf-8"))
+        # 0o666 leaves the file mode to the umask, as Path.write_text does
+        fd = os.open(path, _WRITE_FLAGS, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
     except PermissionError as e:
         raise PermissionError(f"Permission denied writing to: {path}. {e}") from e
     except OSError as e:
         raise OSError(f"Failed to write to: {path}. {e}") from e
 
 
+def store_cache_entry(path: Path, content: str) -> None:
+    """
+    Best-effort atomic write of a cache file; failures only lose the entry.
+
+    The content goes to a temporary sibling first and is renamed into place, so
+    concurrent readers never see a partial entry.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
 def checksum(content: str) -> str:
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    """Return the hex content hash of ``content`` (BLAKE2b, 256-bit)."""
+    return checksum_bytes(content.encode("utf-8"))
+
+
+def checksum_bytes(data: bytes) -> str:
+    """Return the hex content hash of ``data``; same digest as ``checksum``."""
+    return hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
+def file_checksum(path: Path) -> str:
+    """Return the content hash of the file at ``path`` without loading it whole.
+
+    Raises:
+        OSError: If the file can't be read
+    """
+    with path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            digest: str = hashlib.file_digest(f, _content_hasher).hexdigest()
+            return digest
+        hasher = _content_hasher()  # pragma: no cover - Python 3.10
+        for block in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(block)
+        return hasher.hexdigest()
+
+
+def _content_hasher() -> hashlib.blake2b:
+    return hashlib.blake2b(digest_size=32)
@@ -1,10 +1,19 @@
+import json
+from collections import OrderedDict
+from dataclasses import replace
+from pathlib import Path
 from typing import Any
 
-from .chunk import Chunk, chunk_by_strategy, estimate_tokens
+from .chunk import Chunk, _counts_add_up, chunk_by_strategy, estimate_tokens
+from .io import checksum, store_cache_entry
 from .llm_providers import get_provider
 from .llm_strategy import ChunkingStrategy, decide_chunking_strategy
 from .structure import DocumentStructure, extract_structure
 
+# Boundary proposals already fetched in this process, most recent last
+_PROPOSAL_CACHE_SIZE = 128
+_proposal_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
 
 def _serialize_chunks(chunks: list[Chunk]) -> list[dict[str, Any]]:
     return [
@@ -12,17 +21,62 @@ def _serialize_chunks(chunks: list[Chunk]) -> list[dict[str, Any]]:
             "id": c.id,
             "title": c.title,
             "level": c.level,
-            "token_count": estimate_tokens(c.content),
+            "token_count": c.token_count,
         }
         for c in chunks
     ]
 
 
+def _covers(markdown_text: str, chunks: list[Chunk]) -> bool:
+    """
+    Check that the chunk contents concatenate to ``markdown_text``.
+
+    Surrounding whitespace is ignored, as with comparing
+    ``"".join(contents).strip()`` to ``markdown_text.strip()``, but each chunk
+    is matched in place so neither side is copied.
+    """
+    lo, hi = 0, len(markdown_text)
+    while lo < hi and markdown_text[lo].isspace():
+        lo += 1
+    while hi > lo and markdown_text[hi - 1].isspace():
+        hi -= 1
+
+    pieces = [c.content for c in chunks]
+    first, last = 0, len(pieces)
+    while first < last and (not pieces[first] or pieces[first].isspace()):
+        first += 1
+    while last > first and (not pieces[last - 1] or pieces[last - 1].isspace()):
+        last -= 1
+    if first == last:
+        return lo == hi
+    pieces = pieces[first:last]
+    pieces[0] = pieces[0].lstrip()
+    pieces[-1] = pieces[-1].rstrip()
+
+    if sum(map(len, pieces)) != hi - lo:
+        return False
+    pos = lo
+    for piece in pieces:
+        if not markdown_text.startswith(piece, pos):
+            return False
+        pos += len(piece)
+    return True
+
+
+def _renumbered(chunks: list[Chunk]) -> list[Chunk]:
+    """Give chunks sequential ids, copying (not mutating) the caller's chunks."""
+    return [
+        ch if ch.id == i else replace(ch, id=i) for i, ch in enumerate(chunks, start=1)
+    ]
+
+
 def _apply_operations(
     markdown_text: str, chunks: list[Chunk], plan: dict[str, Any]
 ) -> list[Chunk]:
     ops = plan.get("operations") or []
-    result = list(chunks)
+    # Track merges as [first, last) ranges of the input chunks and build each
+    # merged chunk once at the end, so chained merges don't re-copy content
+    spans = [(i, i + 1) for i in range(len(chunks))]
     for op in ops:
         if op.get("type") == "merge":
             start, end = op.get("range", [None, None])
@@ -30,24 +84,31 @@ def _apply_operations(
                 continue
             # Treat provided range as 1-based, inclusive; convert to 0-based slice [s:e)
             s = max(1, int(start)) - 1
-            e = min(len(result), int(end))
-            if s < 0 or e > len(result) or s >= e:
+            e = min(len(spans), int(end))
+            if s < 0 or e > len(spans) or s >= e:
                 continue
-            merged_content = "".join(ch.content for ch in result[s:e])
-            merged = Chunk(
-                id=result[s].id,
-                title=result[s].title,
-                level=result[s].level,
-                content=merged_content,
-            )
-            result = result[:s] + [merged] + result[e:]
+            spans[s:e] = ((spans[s][0], spans[e - 1][1]),)
         # Future: handle split operation as needed
 
+    result: list[Chunk] = []
+    for first, last in spans:
+        head = chunks[first]
+        if last - first == 1:
+            result.append(head)
+            continue
+        result.append(
+            Chunk(
+                id=head.id,
+                title=head.title,
+                level=head.level,
+                content="".join(ch.content for ch in chunks[first:last]),
+            )
+        )
+
     # Reassign sequential IDs and return
-    for i, ch in enumerate(result, start=1):
-        ch.id = i
+    result = _renumbered(result)
     # Safety: ensure coverage preserved
-    assert "".join(c.content for c in result).strip() == markdown_text.strip()
+    assert _covers(markdown_text, result)
     return result
 
 
@@ -84,6 +145,83 @@ def _llm_propose_boundaries(
         return None
 
 
+def _llm_propose_boundaries_batch(
+    documents: list[tuple[str, list[dict[str, Any]]]],
+    *,
+    language_hint: str = "auto",
+    provider: str = "local",
+    max_tokens: int = 1200,
+    min_tokens: int = 200,
+    model: str | None = None,
+    base_url: str | None = None,
+    api_key: str | None = None,
+) -> list[dict[str, Any] | None]:
+    provider_impl = get_provider(
+        provider,
+        model=model,
+        base_url=base_url,
+        api_key=api_key,
+    )
+    if provider_impl is None:
+        return [None] * len(documents)
+
+    try:
+        proposals = provider_impl.propose_chunk_operations_batch(
+            documents,
+            min_tokens=min_tokens,
+            max_tokens=max_tokens,
+            language_hint=language_hint,
+        )
+    except Exception:
+        return [None] * len(documents)
+    if len(proposals) != len(documents):
+        return [None] * len(documents)
+    return proposals
+
+
+def _proposal_key(
+    markdown_text: str, chunks_schema: list[dict[str, Any]], params: dict[str, Any]
+) -> str:
+    """Hash everything a proposal depends on (the API key is deliberately left out)."""
+    payload = json.dumps([chunks_schema, params], sort_keys=True, ensure_ascii=False)
+    return checksum(f"{checksum(markdown_text)}:{payload}")
+
+
+def _load_proposal(key: str, cache_dir: Path | None) -> dict[str, Any] | None:
+    proposal = _proposal_cache.get(key)
+    if proposal is not None:
+        _proposal_cache.move_to_end(key)
+        return proposal
+    if cache_dir is None:
+        return None
+    try:
+        proposal = json.loads((cache_dir / f"{key}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None  # Miss, or an entry another worker is still writing
+    if not isinstance(proposal, dict):
+        return None
+    _remember_proposal(key, proposal)
+    return proposal
+
+
+def _store_proposal(key: str, proposal: dict[str, Any], cache_dir: Path | None) -> None:
+    _remember_proposal(key, proposal)
+    if cache_dir is None:
+        return
+    try:
+        payload = json.dumps(proposal, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return
+    store_cache_entry(cache_dir / f"{key}.json", payload)
+
+
+def _remember_proposal(key: str, proposal: dict[str, Any]) -> None:
+    _proposal_cache[key] = proposal
+    _proposal_cache.move_to_end(key)
+    if len(_proposal_cache) > _PROPOSAL_CACHE_SIZE:
+        _proposal_cache.popitem(last=False)
+
+
 def chunk_with_llm_strategy(
     markdown_text: str,
     min_tokens: int,
@@ -92,12 +230,14 @@ def chunk_with_llm_strategy(
     provider: str = "local",
     model: str | None = None,
     base_url: str | None = None,
+    cache_dir: Path | None = None,
 ) -> tuple[list[Chunk] | None, DocumentStructure, ChunkingStrategy | None]:
     """Attempt to chunk using an LLM-selected strategy.
 
     Returns a tuple of (chunks, structure, strategy). ``chunks`` will be ``None``
     when no strategy is available or when the chosen strategy cannot be
     applied, allowing callers to fall back to heuristic chunking.
+    ``cache_dir`` enables the cross-run cache of strategy responses.
     """
 
     structure = extract_structure(markdown_text)
@@ -115,6 +255,7 @@ def chunk_with_llm_strategy(
         provider=provider,
         model=effective_model or "",
         base_url=effective_base_url or "",
+        cache_dir=cache_dir,
     )
 
     if strategy is None:
@@ -145,23 +286,135 @@ def validate_and_adjust_chunks(
     model: str | None = None,
     base_url: str | None = None,
     api_key: str | None = None,
+    cache: bool = True,
+    cache_dir: Path | None = None,
 ) -> list[Chunk]:
     """
     Ask an LLM to propose merges/splits, then apply them.
     Guarantees coverage is preserved.
     If LLM is unavailable or returns invalid output, returns the original chunks.
+
+    With ``cache`` enabled, proposals are reused for identical markdown, chunks
+    and LLM settings: in memory for this process, and across runs when
+    ``cache_dir`` is given.
     """
-    proposal = _llm_propose_boundaries(
-        markdown_text,
-        _serialize_chunks(chunks),
+    return validate_and_adjust_chunks_batch(
+        [(markdown_text, chunks)],
+        min_tokens,
+        max_tokens,
         language_hint=language_hint,
         provider=provider,
-        max_tokens=max_tokens,
-        min_tokens=min_tokens,
         model=model,
         base_url=base_url,
         api_key=api_key,
+        cache=cache,
+        cache_dir=cache_dir,
+    )[0]
+
+
+def validate_and_adjust_chunks_batch(
+    documents: list[tuple[str, list[Chunk]]],
+    min_tokens: int,
+    max_tokens: int,
+    *,
+    language_hint: str = "auto",
+    provider: str = "local",
+    model: str | None = None,
+    base_url: str | None = None,
+    api_key: str | None = None,
+    cache: bool = True,
+    cache_dir: Path | None = None,
+) -> list[list[Chunk]]:
+    """
+    Like ``validate_and_adjust_chunks`` for several ``(markdown, chunks)`` pairs.
+
+    Documents without a cached proposal are sent to the provider together, so
+    it can pack them into fewer LLM requests; documents whose chunks already
+    fall within ``[min_tokens, max_tokens]`` are not sent at all. Returns the
+    adjusted chunks for each document, in order.
+    """
+    params: dict[str, Any] = {
+        "language_hint": language_hint,
+        "provider": provider,
+        "max_tokens": max_tokens,
+        "min_tokens": min_tokens,
+        "model": model,
+        "base_url": base_url,
+    }
+    schemas = [_serialize_chunks(chunks) for _, chunks in documents]
+    keys = [
+        _proposal_key(markdown_text, schema, params) if cache else None
+        for (markdown_text, _), schema in zip(documents, schemas)
+    ]
+    proposals = [_load_proposal(key, cache_dir) if key else None for key in keys]
+
+    # Chunks already within bounds leave the LLM nothing to fix, so skip the call
+    missing = [
+        i
+        for i, proposal in enumerate(proposals)
+        if proposal is None
+        and not _within_bounds(documents[i][1], min_tokens, max_tokens)
+    ]
+    if len(missing) == 1:
+        (i,) = missing
+        fetched = [
+            _llm_propose_boundaries(
+                documents[i][0],
+                schemas[i],
+                language_hint=language_hint,
+                provider=provider,
+                max_tokens=max_tokens,
+                min_tokens=min_tokens,
+                model=model,
+                base_url=base_url,
+                api_key=api_key,
+            )
+        ]
+    elif missing:
+        fetched = _llm_propose_boundaries_batch(
+            [(documents[i][0], schemas[i]) for i in missing],
+            language_hint=language_hint,
+            provider=provider,
+            max_tokens=max_tokens,
+            min_tokens=min_tokens,
+            model=model,
+            base_url=base_url,
+            api_key=api_key,
+        )
+    else:
+        fetched = []
+    for i, proposal in zip(missing, fetched):
+        proposals[i] = proposal
+        key = keys[i]
+        if proposal and key is not None:
+            _store_proposal(key, proposal, cache_dir)
+
+    return [
+        _adjust_with_proposal(markdown_text, chunks, proposal, min_tokens)
+        for (markdown_text, chunks), proposal in zip(documents, proposals)
+    ]
+
+
+def _merge_group(group: list[Chunk]) -> Chunk:
+    """Merge consecutive chunks, keeping the first non-empty title."""
+    return Chunk(
+        id=group[0].id,
+        title=next((c.title for c in group if c.title), group[-1].title),
+        level=min(c.level for c in group),
+        content="".join(c.content for c in group),
     )
+
+
+def _within_bounds(chunks: list[Chunk], min_tokens: int, max_tokens: int) -> bool:
+    return all(min_tokens <= c.token_count <= max_tokens for c in chunks)
+
+
+def _adjust_with_proposal(
+    markdown_text: str,
+    chunks: list[Chunk],
+    proposal: dict[str, Any] | None,
+    min_tokens: int,
+) -> list[Chunk]:
     if not proposal:
         return chunks
 
@@ -170,23 +423,36 @@ def validate_and_adjust_chunks(
     except Exception:
         return chunks
 
-    # Optional: enforce min/max softly via further merges (not using LLM)
-    result: list[Chunk] = []
+    # Optional: enforce min/max softly via further merges (not using LLM).
+    # Runs of small chunks are grouped, then each group is merged once by
+    # _merge_group into a new Chunk (the caller's chunks may still be
+    # referenced). Group counts are summed where token counts provably add up;
+    # only other joins re-encode the group's text so far.
+    groups: list[list[Chunk]] = []
+    group_tokens = 0
+    # Whether group_tokens is the group's real count rather than the
+    # below-the-bound shortcut, which can't be summed
+    group_exact = True
+    below = min_tokens - 1
     for ch in adjusted:
-        if result and estimate_tokens(result[-1].content) < min_tokens:
-            prev = result.pop()
-            result.append(
-                Chunk(
-                    id=prev.id,
-                    title=prev.title or ch.title,
-                    level=min(prev.level, ch.level),
-                    content=prev.content + ch.content,
-                )
-            )
+        if groups and group_tokens < min_tokens:
+            group = groups[-1]
+            if group_exact and _counts_add_up(group[-1].content, ch.content):
+                group_tokens += ch.token_count
+            else:
+                joined = "".join(c.content for c in group) + ch.content
+                # Only the comparison matters here, so groups that provably
+                # stay under min_tokens skip the tokenizer
+                group_tokens = estimate_tokens(joined, upper_bound=below)
+                group_exact = len(joined) > below or len(joined.encode("utf-8")) > below
+            group.append(ch)
         else:
-            result.append(ch)
+            groups.append([ch])
+            group_tokens = ch.token_count
+            group_exact = True
+
+    result = [group[0] if len(group) == 1 else _merge_group(group) for group in groups]
 
-    for i, ch in enumerate(result, start=1):
-        ch.id = i
-    assert "".join(c.content for c in result).strip() == markdown_text.strip()
+    result = _renumbered(result)
+    assert _covers(markdown_text, result)
     return result
@@ -5,7 +5,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Protocol
 
-from .llm_strategy import ChunkingStrategy, decide_chunking_strategy
+from .llm_strategy import (
+    ChunkingStrategy,
+    decide_chunking_strategies,
+    decide_chunking_strategy,
+)
 from .structure import extract_structure
 
 
@@ -22,6 +26,15 @@ class LLMProvider(Protocol):
         language_hint: str = "auto",
     ) -> dict[str, Any] | None: ...
 
+    def propose_chunk_operations_batch(
+        self,
+        documents: list[tuple[str, list[dict[str, Any]]]],
+        *,
+        min_tokens: int,
+        max_tokens: int,
+        language_hint: str = "auto",
+    ) -> list[dict[str, Any] | None]: ...
+
 
 @dataclass
 class OllamaProvider:
@@ -51,6 +64,27 @@ class OllamaProvider:
             return None
         return _strategy_to_plan(strategy)
 
+    def propose_chunk_operations_batch(
+        self,
+        documents: list[tuple[str, list[dict[str, Any]]]],
+        *,
+        min_tokens: int,
+        max_tokens: int,
+        language_hint: str = "auto",
+    ) -> list[dict[str, Any] | None]:
+        strategies = decide_chunking_strategies(
+            [
+                (markdown_text, extract_structure(markdown_text))
+                for markdown_text, _ in documents
+            ],
+            min_tokens,
+            max_tokens,
+            provider="local",
+            model=self.model,
+            base_url=self.base_url,
+        )
+        return [_strategy_to_plan(s) if s else None for s in strategies]
+
 
 @dataclass
 class OpenAIProvider:
@@ -69,6 +103,16 @@ class OpenAIProvider:
         # OpenAI provider is not yet implemented; return None to signal fallback.
         return None
 
+    def propose_chunk_operations_batch(
+        self,
+        documents: list[tuple[str, list[dict[str, Any]]]],
+        *,
+        min_tokens: int,
+        max_tokens: int,
+        language_hint: str = "auto",
+    ) -> list[dict[str, Any] | None]:
+        return [None] * len(documents)
+
 
 def _strategy_to_plan(
     strategy: ChunkingStrategy,
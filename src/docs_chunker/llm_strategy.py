@@ -4,15 +4,40 @@ from __future__ import annotations
 
 import json
 import logging
-import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Literal
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Literal
 
 from .chunk import estimate_tokens
-from .structure import DocumentStructure, get_heading_hierarchy, get_section_preview
+from .io import checksum, store_cache_entry
+from .structure import (
+    DocumentStructure,
+    HeadingInfo,
+    get_heading_hierarchy,
+    get_section_previews,
+)
+
+try:
+    # Optional: the local provider returns None without it; tests mock this
+    import ollama
+except Exception:  # pragma: no cover - optional at test-time
+    ollama = None  # type: ignore
+
+try:
+    # Optional: faster parsing of LLM responses; falls back to the stdlib
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Strategy responses already fetched in this process, most recent last
+_RESPONSE_CACHE_SIZE = 128
+_response_cache: OrderedDict[str, str] = OrderedDict()
+
 
 @dataclass
 class ChunkingStrategy:
@@ -24,19 +49,108 @@ class ChunkingStrategy:
     reasoning: str | None = None
 
 
+# Sections previewed per document in strategy prompts
+_PREVIEW_HEADINGS = 10
+# Characters shown per previewed section
+_PREVIEW_CHARS = 300
+# Rough token allowance for the instructions in a strategy prompt
+_INSTRUCTIONS_BUDGET = 600
+
+# Prompt templates for str.format; literal JSON braces are doubled
+_STRATEGY_PROMPT = (
+    "You are a document chunking expert optimizing for RAG "
+    "(Retrieval-Augmented Generation) systems.\n"
+    "Document statistics:\n"
+    "- Total tokens: {total_tokens}\n"
+    "- Total lines: {total_lines}\n"
+    "- Heading levels present: {min_level} to {max_level}\n\n"
+    "{hierarchy}\n\n"
+    "Sample Content from Sections:\n"
+    "{preview_block}\n\n"
+    "RAG Requirements:\n"
+    "- Minimum tokens per chunk: {min_tokens}\n"
+    "- Maximum tokens per chunk: {max_tokens}\n"
+    "- Goal: Optimize for embedding-based semantic retrieval\n\n"
+    "Task: Analyze this document and decide the optimal chunking strategy.\n"
+    "Considerations:\n"
+    "1. Semantic coherence: keep related content together.\n"
+    "2. Retrieval quality: chunks should be self-contained for embedding search.\n"
+    "3. Token limits: each chunk must be within {min_tokens}-{max_tokens} tokens.\n"
+    "4. Document structure: use natural document boundaries when possible.\n\n"
+    "For structured documents, choose a heading level (1-6) to chunk by.\n"
+    "For unstructured documents, provide custom line boundaries.\n\n"
+    "Return JSON format:\n"
+    "{{\n"
+    '  "strategy": "by_level" | "custom_boundaries",\n'
+    '  "level": 2,\n'
+    '  "boundaries": [0, 150, 300],\n'
+    '  "reasoning": "Brief explanation"\n'
+    "}}"
+)
+
+_UNSTRUCTURED_PROMPT = (
+    "You are a document chunking expert optimizing for RAG "
+    "(Retrieval-Augmented Generation) systems.\n"
+    "The document has no headings.\n"
+    "- Total tokens: {total_tokens}\n"
+    "- Total lines: {total_lines}\n\n"
+    "Provide custom line boundaries so each chunk has "
+    "{min_tokens}-{max_tokens} tokens.\n\n"
+    "Return JSON format:\n"
+    '{{"strategy": "custom_boundaries", "boundaries": [0, 150, 300], '
+    '"reasoning": "Brief explanation"}}'
+)
+
+_STRUCTURE_ONLY_PROMPT = (
+    "You are a document chunking expert optimizing for RAG "
+    "(Retrieval-Augmented Generation) systems.\n"
+    "The document is too large to include full content. Use the structure "
+    "information to decide a chunking strategy.\n\n"
+    "{hierarchy}\n\n"
+    "Constraints:\n"
+    "- Minimum tokens per chunk: {min_tokens}\n"
+    "- Maximum tokens per chunk: {max_tokens}\n"
+    "- Goal: Optimize for embedding-based semantic retrieval.\n\n"
+    "Return JSON format as described previously."
+)
+
+
+def _section_previews(
+    structure: DocumentStructure, markdown_text: str, preview_chars: int
+) -> list[tuple[HeadingInfo, str]]:
+    """Previews for the first headings, shared by the fit check and the prompt.
+
+    Callers compute them once per document and pass them along rather than
+    relying on a cache that would keep whole documents alive.
+    """
+
+    headings = structure.headings[:_PREVIEW_HEADINGS]
+    previews = get_section_previews(markdown_text, headings, preview_chars)
+    return list(zip(headings, previews))
+
+
 def _build_strategy_prompt(
     structure: DocumentStructure,
     markdown_text: str,
     min_tokens: int,
     max_tokens: int,
-    preview_chars: int = 300,
+    preview_chars: int = _PREVIEW_CHARS,
+    previews: list[tuple[HeadingInfo, str]] | None = None,
 ) -> str:
-    """Build a rich prompt including structure and sample content."""
+    """Build a rich prompt including structure and sample content.
+
+    ``previews`` are the ``_section_previews`` already computed for the fit
+    check, if any.
+    """
 
+    if not structure.headings:
+        return _build_unstructured_prompt(structure, min_tokens, max_tokens)
+
+    if previews is None:
+        previews = _section_previews(structure, markdown_text, preview_chars)
     hierarchy = get_heading_hierarchy(structure)
     preview_lines: list[str] = []
-    for heading in structure.headings[:10]:
-        preview = get_section_preview(markdown_text, heading, max_chars=preview_chars)
+    for heading, preview in previews:
         marker = "#" * heading.level
         preview_lines.append(f"{marker} {heading.title}:\n{preview}\n")
 
@@ -44,38 +158,29 @@ def _build_strategy_prompt(
         "\n".join(preview_lines) if preview_lines else "(No section previews available)"
     )
 
-    prompt = (
-        "You are a document chunking expert optimizing for RAG "
-        "(Retrieval-Augmented Generation) systems.\n"
-        "Document statistics:\n"
-        f"- Total tokens: {structure.total_tokens}\n"
-        f"- Total lines: {structure.total_lines}\n"
-        f"- Heading levels present: {structure.min_level} to {structure.max_level}\n\n"
-        f"{hierarchy}\n\n"
-        "Sample Content from Sections:\n"
-        f"{preview_block}\n\n"
-        "RAG Requirements:\n"
-        f"- Minimum tokens per chunk: {min_tokens}\n"
-        f"- Maximum tokens per chunk: {max_tokens}\n"
-        "- Goal: Optimize for embedding-based semantic retrieval\n\n"
-        "Task: Analyze this document and decide the optimal chunking strategy.\n"
-        "Considerations:\n"
-        "1. Semantic coherence: keep related content together.\n"
-        "2. Retrieval quality: chunks should be self-contained for embedding search.\n"
-        "3. Token limits: each chunk must be within "
-        f"{min_tokens}-{max_tokens} tokens.\n"
-        "4. Document structure: use natural document boundaries when possible.\n\n"
-        "For structured documents, choose a heading level (1-6) to chunk by.\n"
-        "For unstructured documents, provide custom line boundaries.\n\n"
-        "Return JSON format:\n"
-        "{\n"
-        '  "strategy": "by_level" | "custom_boundaries",\n'
-        '  "level": 2,\n'
-        '  "boundaries": [0, 150, 300],\n'
-        '  "reasoning": "Brief explanation"\n'
-        "}"
+    return _STRATEGY_PROMPT.format(
+        total_tokens=structure.total_tokens,
+        total_lines=structure.total_lines,
+        min_level=structure.min_level,
+        max_level=structure.max_level,
+        hierarchy=hierarchy,
+        preview_block=preview_block,
+        min_tokens=min_tokens,
+        max_tokens=max_tokens,
+    )
+
+
+def _build_unstructured_prompt(
+    structure: DocumentStructure, min_tokens: int, max_tokens: int
+) -> str:
+    """Short prompt for documents without headings: only line boundaries apply."""
+
+    return _UNSTRUCTURED_PROMPT.format(
+        total_tokens=structure.total_tokens,
+        total_lines=structure.total_lines,
+        min_tokens=min_tokens,
+        max_tokens=max_tokens,
     )
-    return prompt
 
 
 def _build_structure_only_prompt(
@@ -84,17 +189,65 @@ def _build_structure_only_prompt(
     """Prompt focusing solely on structure for large documents."""
 
     hierarchy = get_heading_hierarchy(structure)
+    return _STRUCTURE_ONLY_PROMPT.format(
+        hierarchy=hierarchy, min_tokens=min_tokens, max_tokens=max_tokens
+    )
+
+
+def _build_batch_strategy_prompt(
+    documents: list[tuple[str, DocumentStructure]],
+    min_tokens: int,
+    max_tokens: int,
+    preview_chars: int = _PREVIEW_CHARS,
+    previews: list[list[tuple[HeadingInfo, str]]] | None = None,
+) -> str:
+    """Build one prompt asking for a strategy per document, keyed by index.
+
+    ``previews`` optionally holds each document's ``_section_previews``.
+    """
+
+    blocks: list[str] = []
+    for index, (markdown_text, structure) in enumerate(documents):
+        sections = (
+            previews[index]
+            if previews is not None
+            else _section_previews(structure, markdown_text, preview_chars)
+        )
+        preview_lines = [
+            f"{'#' * heading.level} {heading.title}:\n{preview}\n"
+            for heading, preview in sections
+        ]
+        blocks.append(
+            f"=== Document {index} ===\n"
+            f"- Total tokens: {structure.total_tokens}\n"
+            f"- Total lines: {structure.total_lines}\n"
+            "- Heading levels present: "
+            f"{structure.min_level} to {structure.max_level}\n\n"
+            f"{get_heading_hierarchy(structure)}\n\n"
+            "Sample Content from Sections:\n"
+            + (
+                "\n".join(preview_lines)
+                if preview_lines
+                else "(No section previews available)"
+            )
+        )
+
     prompt = (
         "You are a document chunking expert optimizing for RAG "
         "(Retrieval-Augmented Generation) systems.\n"
-        "The document is too large to include full content. Use the structure "
-        "information to decide a chunking strategy.\n\n"
-        f"{hierarchy}\n\n"
-        "Constraints:\n"
+        f"Decide the optimal chunking strategy for each of the {len(documents)} "
+        "documents below, independently.\n\n" + "\n\n".join(blocks) + "\n\n"
+        "RAG Requirements:\n"
         f"- Minimum tokens per chunk: {min_tokens}\n"
         f"- Maximum tokens per chunk: {max_tokens}\n"
-        "- Goal: Optimize for embedding-based semantic retrieval.\n\n"
-        "Return JSON format as described previously."
+        "- Goal: Optimize for embedding-based semantic retrieval\n\n"
+        "For structured documents, choose a heading level (1-6) to chunk by.\n"
+        "For unstructured documents, provide custom line boundaries.\n\n"
+        "Return a JSON array with one object per document:\n"
+        "[\n"
+        '  {"index": 0, "strategy": "by_level" | "custom_boundaries", '
+        '"level": 2, "boundaries": [0, 150, 300], "reasoning": "Brief explanation"}\n'
+        "]"
     )
     return prompt
 
@@ -103,39 +256,101 @@ def _can_fit_in_context(
     structure: DocumentStructure,
     markdown_text: str,
     max_context_tokens: int = 8000,
-    preview_chars: int = 300,
+    preview_chars: int = _PREVIEW_CHARS,
+    previews: list[tuple[HeadingInfo, str]] | None = None,
 ) -> bool:
     """Heuristic check for whether the prompt can include document previews."""
 
+    if previews is None:
+        previews = _section_previews(structure, markdown_text, preview_chars)
+    # A BPE token covers at least one UTF-8 byte, so a prompt whose parts are
+    # comfortably small in bytes fits without running the tokenizer
+    parts = [get_heading_hierarchy(structure)]
+    parts.extend(p for _, p in previews)
+    total_bytes = sum(len(p) if p.isascii() else len(p.encode("utf-8")) for p in parts)
+    if total_bytes + _INSTRUCTIONS_BUDGET < max_context_tokens:
+        return True
+
+    return (
+        _estimate_prompt_tokens(structure, markdown_text, preview_chars, previews)
+        < max_context_tokens
+    )
+
+
+def _estimate_prompt_tokens(
+    structure: DocumentStructure,
+    markdown_text: str,
+    preview_chars: int = _PREVIEW_CHARS,
+    previews: list[tuple[HeadingInfo, str]] | None = None,
+) -> int:
+    """Rough token size of a strategy prompt covering one document."""
+
+    if previews is None:
+        previews = _section_previews(structure, markdown_text, preview_chars)
     hierarchy_tokens = estimate_tokens(get_heading_hierarchy(structure))
-    preview_tokens = 0
-    for heading in structure.headings[:10]:
-        preview = get_section_preview(markdown_text, heading, max_chars=preview_chars)
-        preview_tokens += estimate_tokens(preview)
+    preview_tokens = sum(estimate_tokens(preview) for _, preview in previews)
 
-    instructions_budget = 600  # rough allowance for instructions in the prompt
-    total_estimate = hierarchy_tokens + preview_tokens + instructions_budget
-    return total_estimate < max_context_tokens
+    return hierarchy_tokens + preview_tokens + _INSTRUCTIONS_BUDGET
 
 
 def _call_ollama_strategy(
     prompt: str,
     model: str = "llama3.1:8b",
     base_url: str = "http://localhost:11434",
+    cache_dir: Path | None = None,
 ) -> str | None:
-    """Call the Ollama API and return the raw response text."""
+    """Call the Ollama API and return the raw response text.
 
+    With ``cache_dir`` set, non-empty responses are cached by a hash of the
+    host, model and prompt, in memory and under ``cache_dir``, so re-runs over
+    unchanged documents skip the model entirely.
+    """
+    if cache_dir is None:
+        return _generate_ollama(prompt, model=model, base_url=base_url)
+
+    # The same model name on another host may be a different model
+    key = checksum(f"strategy:{json.dumps([base_url, model])}:{prompt}")
+    cached = _load_response(key, cache_dir)
+    if cached is not None:
+        return cached
+
+    response = _generate_ollama(prompt, model=model, base_url=base_url)
+    if response:
+        _store_response(key, response, cache_dir)
+    return response
+
+
+def _load_response(key: str, cache_dir: Path) -> str | None:
+    response = _response_cache.get(key)
+    if response is not None:
+        _response_cache.move_to_end(key)
+        return response
     try:
-        import importlib
-
-        ollama = importlib.import_module("ollama")
-    except ModuleNotFoundError:
+        response = (cache_dir / f"{key}.txt").read_text(encoding="utf-8")
+    except OSError:
         return None
-    except Exception:
+    _remember_response(key, response)
+    return response
+
+
+def _store_response(key: str, response: str, cache_dir: Path) -> None:
+    _remember_response(key, response)
+    store_cache_entry(cache_dir / f"{key}.txt", response)
+
+
+def _remember_response(key: str, response: str) -> None:
+    _response_cache[key] = response
+    _response_cache.move_to_end(key)
+    if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+def _generate_ollama(prompt: str, model: str, base_url: str) -> str | None:
+    if ollama is None:
         return None
 
     try:
-        client = ollama.Client(host=base_url)
+        client = _get_ollama_client(ollama.Client, base_url)
         response = client.generate(
             model=model,
             prompt=prompt,
@@ -147,29 +362,36 @@ def _call_ollama_strategy(
         return None
 
 
+@lru_cache(maxsize=8)
+def _get_ollama_client(client_cls: type, base_url: str) -> Any:
+    """Return a shared client per host so its HTTP connections are reused.
+
+    Keyed on the client class too, so a replaced ``ollama`` module takes effect.
+    """
+    return client_cls(host=base_url)
+
+
 def _extract_json_from_response(response_text: str) -> str | None:
-    if not response_text:
+    # Refusals and plain prose carry no object; skip the fence scan for them
+    if not response_text or "{" not in response_text:
         return None
 
-    # Try to find JSON in code blocks with bracket counting for nested structures
-    json_block_match = re.search(r"```(?:json)?\s*(\{)", response_text, re.DOTALL)
-    if json_block_match:
-        start_pos = json_block_match.start(1)
-        # Find the matching closing brace by counting brackets
-        brace_count = 0
-        for i in range(start_pos, len(response_text)):
-            if response_text[i] == "{":
-                brace_count += 1
-            elif response_text[i] == "}":
-                brace_count -= 1
-                if brace_count == 0:
-                    # Found matching closing brace
-                    json_text = response_text[start_pos : i + 1]
-                    # Check if it's followed by closing code block marker
-                    remaining = response_text[i + 1 :].strip()
-                    if remaining.startswith("```") or not remaining.startswith("`"):
-                        return json_text
-                    break
+    # Prefer a fenced block (```json or ```) whose body starts with an object
+    fence = response_text.find("```")
+    while fence != -1:
+        pos = fence + 3
+        if response_text.startswith("json", pos):
+            pos += 4
+        while pos < len(response_text) and response_text[pos].isspace():
+            pos += 1
+        if response_text.startswith("{", pos):
+            end = _matching_brace(response_text, pos)
+            if end != -1:
+                remaining = response_text[end + 1 :].lstrip()
+                if remaining.startswith("```") or not remaining.startswith("`"):
+                    return response_text[pos : end + 1]
+            break
+        fence = response_text.find("```", fence + 1)
 
     # Fallback: find first { and last } (handles nested JSON correctly)
     start = response_text.find("{")
@@ -179,6 +401,41 @@ def _extract_json_from_response(response_text: str) -> str | None:
     return None
 
 
+def _matching_brace(text: str, start: int) -> int:
+    """Index of the ``}`` closing the object at ``start``, or -1 if unbalanced.
+
+    Braces inside JSON strings (including escaped quotes) are not counted.
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def _json_loads(text: str) -> object:
+    """Decode JSON, raising ``ValueError`` on malformed input."""
+    if orjson is not None:
+        return orjson.loads(text)  # orjson.JSONDecodeError subclasses ValueError
+    return json.loads(text)
+
+
 def _parse_strategy_response(response_text: str) -> ChunkingStrategy | None:
     """Parse JSON response into a ``ChunkingStrategy`` instance."""
 
@@ -187,10 +444,43 @@ def _parse_strategy_response(response_text: str) -> ChunkingStrategy | None:
         return None
 
     try:
-        data = json.loads(json_text)
-    except json.JSONDecodeError:
+        data = _json_loads(json_text)
+    except ValueError:
         return None
+    return _strategy_from_data(data)
+
+
+def _parse_batch_strategy_response(
+    response_text: str, count: int
+) -> list[ChunkingStrategy | None]:
+    """Parse a JSON array of indexed strategies; unusable entries are ``None``."""
+
+    strategies: list[ChunkingStrategy | None] = [None] * count
+    start = response_text.find("[") if response_text else -1
+    end = response_text.rfind("]") if response_text else -1
+    if start == -1 or end <= start:
+        return strategies
+    try:
+        items = _json_loads(response_text[start : end + 1])
+    except ValueError:
+        return strategies
+    if not isinstance(items, list):
+        return strategies
 
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        index = item.get("index")
+        if isinstance(index, int) and 0 <= index < count:
+            strategies[index] = _strategy_from_data(item)
+    return strategies
+
+
+def _strategy_from_data(data: object) -> ChunkingStrategy | None:
+    """Validate one decoded strategy object."""
+
+    if not isinstance(data, dict):
+        return None
     strategy_type = data.get("strategy")
     reasoning = data.get("reasoning")
 
@@ -226,11 +516,14 @@ def _decide_strategy_for_large_document(
     *,
     model: str,
     base_url: str,
+    cache_dir: Path | None = None,
 ) -> ChunkingStrategy | None:
     """Fallback path when the document cannot fit entirely into the LLM context."""
 
     prompt = _build_structure_only_prompt(structure, min_tokens, max_tokens)
-    response = _call_ollama_strategy(prompt, model=model, base_url=base_url)
+    response = _call_ollama_strategy(
+        prompt, model=model, base_url=base_url, cache_dir=cache_dir
+    )
     if not response:
         return None
     return _parse_strategy_response(response)
@@ -245,6 +538,7 @@ def decide_chunking_strategy(
     provider: str = "local",
     model: str = "llama3.1:8b",
     base_url: str = "http://localhost:11434",
+    cache_dir: Path | None = None,
 ) -> ChunkingStrategy | None:
     """Determine chunking strategy using the requested provider.
 
@@ -261,6 +555,8 @@ def decide_chunking_strategy(
         provider: LLM provider to use ("local" for Ollama, "openai" for OpenAI)
         model: Model identifier for the chosen provider
         base_url: Base URL for Ollama API (only used with "local" provider)
+        cache_dir: Optional directory for cached LLM responses; identical prompts
+            to the same model reuse the stored response across runs
 
     Returns:
         ChunkingStrategy object if successful, None if LLM unavailable or error occurs.
@@ -295,14 +591,18 @@ def decide_chunking_strategy(
                 has_structure=False,
             )
 
-        if _can_fit_in_context(structure, markdown_text):
+        previews = _section_previews(structure, markdown_text, _PREVIEW_CHARS)
+        if _can_fit_in_context(structure, markdown_text, previews=previews):
             prompt = _build_strategy_prompt(
                 structure,
                 markdown_text,
                 min_tokens,
                 max_tokens,
+                previews=previews,
+            )
+            response = _call_ollama_strategy(
+                prompt, model=model, base_url=base_url, cache_dir=cache_dir
             )
-            response = _call_ollama_strategy(prompt, model=model, base_url=base_url)
             if not response:
                 logger.debug("No response from Ollama API")
                 return None
@@ -314,6 +614,7 @@ def decide_chunking_strategy(
             max_tokens,
             model=model,
             base_url=base_url,
+            cache_dir=cache_dir,
         )
     except Exception as e:
         logger.warning(
@@ -321,3 +622,116 @@ def decide_chunking_strategy(
             exc_info=True,
         )
         return None
+
+
+# Documents packed into one strategy prompt by ``decide_chunking_strategies``
+_STRATEGY_BATCH_SIZE = 4
+# LLM requests ``decide_chunking_strategies`` keeps in flight at once
+_STRATEGY_CONCURRENCY = 4
+
+
+def decide_chunking_strategies(
+    documents: list[tuple[str, DocumentStructure]],
+    min_tokens: int,
+    max_tokens: int,
+    *,
+    provider: str = "local",
+    model: str = "llama3.1:8b",
+    base_url: str = "http://localhost:11434",
+    batch_size: int = _STRATEGY_BATCH_SIZE,
+    max_context_tokens: int = 8000,
+    max_concurrency: int = _STRATEGY_CONCURRENCY,
+    cache_dir: Path | None = None,
+) -> list[ChunkingStrategy | None]:
+    """Determine strategies for several documents with as few LLM calls as possible.
+
+    Documents whose previews fit in the context are packed, up to
+    ``batch_size`` at a time and within ``max_context_tokens``, into one prompt
+    per batch. Documents too large to share a prompt, and entries the model
+    answered unusably, go through ``decide_chunking_strategy`` one at a time.
+    Up to ``max_concurrency`` requests run concurrently on a thread pool.
+    ``cache_dir`` enables the response cache, as for ``decide_chunking_strategy``.
+
+    Returns:
+        One ``ChunkingStrategy`` (or ``None``) per input document, in order.
+    """
+    strategies: list[ChunkingStrategy | None] = [None] * len(documents)
+    if provider != "local":
+        logger.debug(f"Provider '{provider}' not yet implemented, returning None")
+        return strategies
+
+    # Computed once per document for both the packing estimate and the prompt
+    previews = [
+        _section_previews(structure, markdown_text, _PREVIEW_CHARS)
+        for markdown_text, structure in documents
+    ]
+    batches: list[list[int]] = []
+    singles: list[int] = []
+    budget = 0
+    for index, (markdown_text, structure) in enumerate(documents):
+        cost = _estimate_prompt_tokens(
+            structure, markdown_text, previews=previews[index]
+        )
+        if cost >= max_context_tokens:
+            singles.append(index)
+            continue
+        if (
+            not batches
+            or len(batches[-1]) >= batch_size
+            or budget + cost >= max_context_tokens
+        ):
+            batches.append([])
+            budget = 0
+        batches[-1].append(index)
+        budget += cost
+
+    singles.extend(batch[0] for batch in batches if len(batch) == 1)
+    packed = [batch for batch in batches if len(batch) > 1]
+
+    def ask_batch(batch: list[int]) -> list[ChunkingStrategy | None] | None:
+        prompt = _build_batch_strategy_prompt(
+            [documents[i] for i in batch],
+            min_tokens,
+            max_tokens,
+            previews=[previews[i] for i in batch],
+        )
+        try:
+            response = _call_ollama_strategy(
+                prompt, model=model, base_url=base_url, cache_dir=cache_dir
+            )
+        except Exception as e:
+            logger.warning(f"LLM batch strategy decision failed: {e}", exc_info=True)
+            return None
+        if not response:
+            logger.debug("No response from Ollama API")
+            return None
+        return _parse_batch_strategy_response(response, len(batch))
+
+    def ask_single(index: int) -> ChunkingStrategy | None:
+        markdown_text, structure = documents[index]
+        return decide_chunking_strategy(
+            markdown_text,
+            structure,
+            min_tokens,
+            max_tokens,
+            provider=provider,
+            model=model,
+            base_url=base_url,
+            cache_dir=cache_dir,
+        )
+
+    # Requests are network-bound and independent, so keep several in flight
+    workers = max(1, min(max_concurrency, len(packed) + len(singles)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for batch, parsed in zip(packed, executor.map(ask_batch, packed)):
+            if parsed is None:
+                continue
+            for index, strategy in zip(batch, parsed):
+                if strategy is None:
+                    singles.append(index)
+                strategies[index] = strategy
+
+        singles.sort()
+        for index, strategy in zip(singles, executor.map(ask_single, singles)):
+            strategies[index] = strategy
+    return strategies
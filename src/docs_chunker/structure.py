@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass
+from itertools import accumulate, pairwise
+from operator import itemgetter
 
-from .chunk import HEADING_RE, estimate_tokens
+from .chunk import (
+    _find_headings,
+    _get_encoder,
+    _line_offsets,
+    estimate_tokens,
+    estimate_tokens_batch,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class HeadingInfo:
     """Information about a single heading in the document."""
 
@@ -18,9 +27,12 @@ class HeadingInfo:
     token_count: int
     section_start: int
     section_end: int
+    # Character span of the section in the source text; -1 when unknown
+    char_start: int = -1
+    char_end: int = -1
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentStructure:
     """Complete document structure with heading hierarchy metadata."""
 
@@ -32,75 +44,133 @@ class DocumentStructure:
     has_structure: bool
 
 
+_NON_SPACE_RE = re.compile(r"\S")
+# Line boundaries of str.splitlines other than "\n" and "\r"
+_RARE_LINE_BREAKS = "\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+
+def _count_lines(text: str) -> int:
+    """Return ``len(text.splitlines())`` without building the list."""
+
+    if any(ch in text for ch in _RARE_LINE_BREAKS):
+        return len(text.splitlines())
+    breaks = text.count("\n") + text.count("\r") - text.count("\r\n")
+    return breaks if text.endswith(("\n", "\r")) or not text else breaks + 1
+
+
+def _section_token_counts(
+    markdown_text: str,
+    lines: list[str],
+    offsets: list[int],
+    starts: list[int],
+    ends: list[int],
+) -> tuple[list[int], int]:
+    """Token counts of the sections ``lines[starts[i]:ends[i]]`` and the document.
+
+    ``offsets`` are the line start offsets from ``_line_offsets(lines)``. Every
+    document line is tokenized at most once: nested sections overlap, so their
+    counts (and the document total) are summed from the segments between
+    consecutive headings.
+    """
+    if _get_encoder("gpt-4") is None:
+        # Same heuristic as estimate_tokens, straight from the line offsets
+        return (
+            [max(1, (offsets[e] - offsets[s]) // 4) for s, e in zip(starts, ends)],
+            estimate_tokens(markdown_text),
+        )
+    if any(start and not lines[start - 1].endswith(("\n", "\r")) for start in starts):
+        # Exotic line breaks may join a heading to the previous pre-token
+        return (
+            estimate_tokens_batch(
+                [markdown_text[offsets[s] : offsets[e]] for s, e in zip(starts, ends)]
+            ),
+            estimate_tokens(markdown_text),
+        )
+
+    # A heading line follows a newline, where tiktoken always starts a new
+    # pre-token, so section counts add up over the segments they contain
+    bounds = [*starts, len(lines)]
+    if starts[0]:
+        # Text before the first heading only contributes to the total
+        bounds.insert(0, 0)
+    segment_counts = estimate_tokens_batch(
+        [markdown_text[offsets[a] : offsets[b]] for a, b in pairwise(bounds)]
+    )
+    totals = [0, *accumulate(segment_counts)]
+    segment_of = {line: i for i, line in enumerate(bounds)}
+    counts = [
+        max(1, totals[segment_of[e]] - totals[segment_of[s]])
+        for s, e in zip(starts, ends)
+    ]
+    return counts, max(1, totals[-1])
+
+
 def extract_structure(markdown_text: str) -> DocumentStructure:
     """Extract heading hierarchy and metadata from Markdown text."""
 
-    # Regex patterns for code block delimiters
-    code_block_open_re = re.compile(r"^```[a-zA-Z0-9_-]*$")
-    code_block_close_re = re.compile(r"^```\s*$")
-
-    lines = markdown_text.splitlines(keepends=True)
-    headings_raw: list[tuple[int, int, str]] = []
-    in_code_block = False
-
-    for idx, line in enumerate(lines):
-        # Strip line ending for delimiter detection, but keep original
-        # for heading matching
-        line_stripped = line.rstrip("\r\n")
-
-        # Check if this line is a code block delimiter
-        if code_block_open_re.match(line_stripped):
-            in_code_block = True
-            continue
-        elif code_block_close_re.match(line_stripped):
-            in_code_block = False
-            continue
-
-        # Only check for headings when not inside a code block
-        if not in_code_block:
-            match = HEADING_RE.match(line)
-            if match:
-                level = len(match.group(1))
-                title = match.group(2).strip()
-                headings_raw.append((idx, level, title))
+    if "#" in markdown_text:
+        lines = markdown_text.splitlines(keepends=True)
+        # Same scan as the chunker: fenced code is skipped and only lines
+        # starting with "#" are parsed
+        headings_raw = _find_headings(lines)
+        total_lines = len(lines)
+    else:
+        # No heading is possible, so the lines only need counting
+        lines = []
+        headings_raw = []
+        total_lines = _count_lines(markdown_text)
 
     headings: list[HeadingInfo] = []
-    total_lines = len(lines)
-    total_tokens = estimate_tokens(markdown_text)
 
     if not headings_raw:
         return DocumentStructure(
             headings=[],
-            total_tokens=total_tokens,
+            total_tokens=estimate_tokens(markdown_text),
             total_lines=total_lines,
             min_level=0,
             max_level=0,
             has_structure=False,
         )
 
-    for i, (line_idx, level, title) in enumerate(headings_raw):
-        next_boundary = total_lines
-        for candidate_line, candidate_level, _ in headings_raw[i + 1 :]:
-            if candidate_level <= level:
-                next_boundary = candidate_line
-                break
-        section_start = line_idx
-        section_end = next_boundary
-        section_lines = lines[section_start:section_end]
-        section_text = "".join(section_lines)
-        token_count = estimate_tokens(section_text)
+    # A section runs until the next heading of the same or a higher level;
+    # scanning backwards with a stack finds every end in one pass
+    section_ends = [total_lines] * len(headings_raw)
+    pending: list[tuple[int, int]] = []
+    for i in range(len(headings_raw) - 1, -1, -1):
+        line_idx, level, _ = headings_raw[i]
+        while pending and pending[-1][1] > level:
+            pending.pop()
+        if pending:
+            section_ends[i] = pending[-1][0]
+        pending.append((line_idx, level))
+
+    offsets = _line_offsets(lines)
+    token_counts, total_tokens = _section_token_counts(
+        markdown_text,
+        lines,
+        offsets,
+        [line_idx for line_idx, _, _ in headings_raw],
+        section_ends,
+    )
+
+    for (line_idx, level, title), section_end, token_count in zip(
+        headings_raw, section_ends, token_counts
+    ):
         headings.append(
             HeadingInfo(
                 level=level,
                 title=title,
                 line_idx=line_idx,
                 token_count=token_count,
-                section_start=section_start,
+                section_start=line_idx,
                 section_end=section_end,
+                char_start=offsets[line_idx],
+                char_end=offsets[section_end],
             )
         )
 
-    levels = [h.level for h in headings]
+    # At most six distinct levels, so min/max of the set are trivial
+    levels = set(map(itemgetter(1), headings_raw))
     min_level = min(levels)
     max_level = max(levels)
 
@@ -114,6 +184,12 @@ def extract_structure(markdown_text: str) -> DocumentStructure:
     )
 
 
+# Indent and marker per heading level in the hierarchy listing
+_HIERARCHY_PREFIXES = tuple(
+    "  " * max(0, level - 1) + "#" * level for level in range(7)
+)
+
+
 def get_heading_hierarchy(structure: DocumentStructure) -> str:
     """Format heading hierarchy as readable text."""
 
@@ -122,10 +198,14 @@ def get_heading_hierarchy(structure: DocumentStructure) -> str:
         lines.append("  (No headings found)")
         return "\n".join(lines)
 
+    prefixes = _HIERARCHY_PREFIXES
     for heading in structure.headings:
-        indent = "  " * max(0, heading.level - 1)
-        marker = "#" * heading.level
-        lines.append(f"{indent}{marker} {heading.title} ({heading.token_count} tokens)")
+        level = heading.level
+        if 0 <= level < len(prefixes):
+            prefix = prefixes[level]
+        else:
+            prefix = "  " * max(0, level - 1) + "#" * level
+        lines.append(f"{prefix} {heading.title} ({heading.token_count} tokens)")
     return "\n".join(lines)
 
 
@@ -134,17 +214,79 @@ def get_section_preview(
 ) -> str:
     """Return preview text for a section bounded by a heading."""
 
+    return get_section_previews(markdown_text, [heading], max_chars=max_chars)[0]
+
+
+def get_section_previews(
+    markdown_text: str, headings: Sequence[HeadingInfo], max_chars: int = 300
+) -> list[str]:
+    """Return ``get_section_preview`` for each heading, splitting the text once."""
+
     if max_chars < 0:
         raise ValueError("max_chars must be non-negative")
 
+    if all(h.char_end >= 0 for h in headings):
+        # Sections from extract_structure are sliced straight from the text
+        if max_chars == 0:
+            return [""] * len(headings)
+        return [
+            _preview_span(markdown_text, h.char_start, h.char_end, max_chars)
+            for h in headings
+        ]
+
+    spans = [(h.section_start, h.section_end) for h in headings]
+    return _section_previews(markdown_text, spans, max_chars)
+
+
+def _section_previews(
+    markdown_text: str, spans: Sequence[tuple[int, int]], max_chars: int
+) -> list[str]:
     lines = markdown_text.splitlines(keepends=True)
-    start = max(0, heading.section_start)
-    end = heading.section_end if heading.section_end >= 0 else len(lines)
-    end = min(len(lines), end)
-    section_lines = lines[start:end]
-    section_text = "".join(section_lines).strip()
-    if max_chars == 0:
+    previews = []
+    for section_start, section_end in spans:
+        start = max(0, section_start)
+        end = section_end if section_end >= 0 else len(lines)
+        end = min(len(lines), end)
+        if max_chars == 0:
+            previews.append("")
+        else:
+            previews.append(_preview_section(lines, start, end, max_chars))
+    return previews
+
+
+def _preview_span(text: str, start: int, end: int, max_chars: int) -> str:
+    """Preview of ``text[start:end]`` that copies at most ``max_chars`` of it."""
+
+    first = _NON_SPACE_RE.search(text, start, end)
+    if first is None:
         return ""
+    start = first.start()
+    if end - start > max_chars and _NON_SPACE_RE.search(text, start + max_chars, end):
+        return text[start : start + max_chars].rstrip() + "…"
+    return text[start:end].rstrip()
+
+
+def _preview_section(lines: list[str], start: int, end: int, max_chars: int) -> str:
+    """Preview of ``lines[start:end]``, joining only as much as the preview needs.
+
+    Top-level sections can span most of the document, so rather than joining the
+    whole section to keep its first ``max_chars`` characters, lines are gathered
+    until the text is known to run past the limit.
+    """
+    parts: list[str] = []
+    size = 0
+    check_at = max_chars
+    for i in range(start, end):
+        parts.append(lines[i])
+        size += len(lines[i])
+        if size > check_at:
+            head = "".join(parts).lstrip()
+            # Non-whitespace past the limit means strip() can't bring it under
+            if len(head) > max_chars and not head[max_chars:].isspace():
+                return head[:max_chars].rstrip() + "…"
+            check_at = size * 2
+
+    section_text = "".join(parts).strip()
     if len(section_text) <= max_chars:
         return section_text
     return section_text[:max_chars].rstrip() + "…"
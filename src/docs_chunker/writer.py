@@ -1,37 +1,48 @@
 import re
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
-from .chunk import Chunk, estimate_tokens
-from .io import checksum, ensure_dir, output_paths_for, write_text
+from .chunk import _LINE_BREAK_RE, HEADING_RE, Chunk
+from .io import checksum, ensure_dir, output_paths_for, remove_files, write_texts
 
+_SLUG_DROP_RE = re.compile(r"[^\w\-\s\u0590-\u05FF]")  # keep Hebrew and word chars
+_SLUG_SEPARATOR_RE = re.compile(r"[\s_]+")
+# A level-2 heading at the start of any line (the line breaks of str.splitlines)
+_H2_RE = re.compile(r"(?:^|(?<=[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]))##\s")
+# Titles PyYAML emits as bare plain scalars: words separated by single spaces
+_PLAIN_TITLE_RE = re.compile(r"[^\W\d_]\w*(?: \w+)*")
+# Plain words PyYAML would resolve to booleans or null, so it quotes them
+_YAML_KEYWORDS = frozenset("y n yes no on off true false null".split())
+# libyaml's emitter when PyYAML was built with it; it may quote unusual titles
+# differently from the pure-Python dumper, but both load back the same
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+# Keep the fast path clear of PyYAML's line folding at width 80
+_PLAIN_TITLE_MAX = 60
 
+
+@lru_cache(maxsize=1024)
 def slugify(text: str) -> str:
     text = text.strip().lower()
-    text = re.sub(r"[^\w\-\s\u0590-\u05FF]", "", text)  # keep Hebrew and word chars
-    text = re.sub(r"[\s_]+", "-", text)
+    text = _SLUG_DROP_RE.sub("", text)
+    text = _SLUG_SEPARATOR_RE.sub("-", text)
     return text[:50] or "chunk"
 
 
 def _fallback_split_single_chunk(ch: Chunk) -> list[Chunk]:
-    lines = ch.content.splitlines(keepends=True)
     # Find first level-2 heading boundary within the content
-    first_h2_idx = None
-    for idx, line in enumerate(lines):
-        m = re.match(r"^(##)\s+", line)
-        if m:
-            first_h2_idx = idx
-            break
-    if first_h2_idx is None or first_h2_idx == 0:
+    m = _H2_RE.search(ch.content)
+    if m is None or m.start() == 0:
         return [ch]
 
-    part1 = "".join(lines[:first_h2_idx])
-    part2 = "".join(lines[first_h2_idx:])
+    part1 = ch.content[: m.start()]
+    part2 = ch.content[m.start() :]
 
     # Titles from headings at the start of each part if present
     def title_level(text: str) -> tuple[str, int]:
-        m = re.match(r"^(#{1,6})\s+(.*)$", text.splitlines()[0] if text else "")
+        line_end = _LINE_BREAK_RE.search(text)
+        m = HEADING_RE.match(text[: line_end.start()] if line_end else text)
         if m:
             return m.group(2).strip(), len(m.group(1))
         return ch.title, ch.level
@@ -45,13 +56,41 @@ def _fallback_split_single_chunk(ch: Chunk) -> list[Chunk]:
     ]
 
 
+def _front_matter(ch: Chunk, digest: str) -> str:
+    """YAML front-matter for a chunk, as ``yaml.safe_dump`` with sorted keys.
+
+    The schema is fixed, so common titles are formatted directly; anything
+    that might need quoting or folding goes through PyYAML, using the libyaml
+    emitter when it is available.
+    """
+    title = ch.title
+    if (
+        len(title) <= _PLAIN_TITLE_MAX
+        and _PLAIN_TITLE_RE.fullmatch(title)
+        and title.lower() not in _YAML_KEYWORDS
+        and not digest.isdigit()
+    ):
+        return (
+            f"---\nchecksum: {digest}\nid: {ch.id}\nlevel: {ch.level}\n"
+            f"title: {title}\ntoken_count: {ch.token_count}\n---\n"
+        )
+    meta = {
+        "id": ch.id,
+        "title": title,
+        "level": ch.level,
+        "token_count": ch.token_count,
+        "checksum": digest,
+    }
+    dumped = yaml.dump(meta, Dumper=_YAML_DUMPER, allow_unicode=True, sort_keys=True)
+    return f"---\n{dumped}---\n"
+
+
 def save_chunks(input_path: Path, chunks: list[Chunk]) -> None:
     base_dir, chunks_dir = output_paths_for(input_path)
     ensure_dir(chunks_dir)
 
     # Clear old chunks to avoid leftovers from previous runs
-    for old_file in chunks_dir.glob("*.md"):
-        old_file.unlink()
+    remove_files(chunks_dir, ".md")
 
     # Fallback: ensure at least two chunks when feasible
     if len(chunks) == 1:
@@ -61,17 +100,10 @@ def save_chunks(input_path: Path, chunks: list[Chunk]) -> None:
             for i, c in enumerate(chunks, start=1):
                 c.id = i
 
+    files: list[tuple[Path, str]] = []
     for idx, ch in enumerate(chunks, start=1):
-        meta = {
-            "id": ch.id,
-            "title": ch.title,
-            "level": ch.level,
-            "token_count": estimate_tokens(ch.content),
-            "checksum": checksum(ch.content),
-        }
-        front = (
-            "---\n" + yaml.safe_dump(meta, allow_unicode=True, sort_keys=True) + "---\n"
-        )
+        front = _front_matter(ch, checksum(ch.content))
         slug = slugify(ch.title)
         filename = f"{idx:03d}_{slug}.md"
-        write_text(chunks_dir / filename, front + ch.content)
+        files.append((chunks_dir / filename, front + ch.content))
+    write_texts(files)
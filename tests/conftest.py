@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+import pytest
+from typer.testing import CliRunner
+
+# Markdown returned by the fake converter: Hebrew and English, headings preserved
+FAKE_MARKDOWN = "# כותרת ראשית\n\n## Section 1\nParagraph EN.\n\n## סעיף 2\nפסקה HE.\n"
+
+# Markdown returned by the counting converter; distinct from FAKE_MARKDOWN
+COUNTING_MARKDOWN = "# Counted\n\nbody text\n"
+
+
+class FakeMarkItDown:
+    def convert(self, path: str):
+        return SimpleNamespace(text_content=FAKE_MARKDOWN)
+
+
+@pytest.fixture(scope="session")
+def fake_markitdown_cls():
+    return FakeMarkItDown
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    return CliRunner()
+
+
+@pytest.fixture
+def patched_convert(monkeypatch, fake_markitdown_cls):
+    from docs_chunker import convert as convert_mod
+
+    monkeypatch.setattr(convert_mod, "MarkItDown", fake_markitdown_cls)
+    return fake_markitdown_cls
+
+
+@pytest.fixture
+def counting_convert(monkeypatch):
+    """Patch in a converter that records its instances and converted paths."""
+    from docs_chunker import convert as convert_mod
+
+    class CountingMarkItDown:
+        markdown = COUNTING_MARKDOWN
+        created: list["CountingMarkItDown"] = []
+        calls: list[str] = []
+
+        def __init__(self):
+            CountingMarkItDown.created.append(self)
+
+        def convert(self, path: str):
+            CountingMarkItDown.calls.append(path)
+            return SimpleNamespace(text_content=self.markdown)
+
+    monkeypatch.setattr(convert_mod, "MarkItDown", CountingMarkItDown)
+    return CountingMarkItDown
@@ -1,5 +1,7 @@
 import textwrap
 
+import pytest
+
 from docs_chunker.chunk import chunk_by_strategy, chunk_markdown, estimate_tokens
 from docs_chunker.llm_strategy import ChunkingStrategy
 from docs_chunker.structure import extract_structure
@@ -44,6 +46,21 @@ def test_chunk_markdown_headings_and_hebrew_preserved():
         assert estimate_tokens(c.content) > 0
 
 
+def test_chunk_markdown_iter_is_lazy_and_matches_list_api():
+    import types
+
+    from docs_chunker.chunk import chunk_markdown_iter
+
+    chunks_iter = chunk_markdown_iter(SAMPLE_MD, min_tokens=5, max_tokens=200)
+    assert isinstance(chunks_iter, types.GeneratorType)
+    expected = chunk_markdown(SAMPLE_MD, min_tokens=5, max_tokens=200)
+    assert list(chunks_iter) == expected
+
+    # Invalid arguments are rejected before iteration starts
+    with pytest.raises(ValueError):
+        chunk_markdown_iter(SAMPLE_MD, min_tokens=0)
+
+
 def test_paragraph_splitting_preserves_exact_whitespace():
     """Test that splitting by paragraphs preserves exact whitespace."""
     # Create content with varying whitespace between paragraphs
@@ -278,3 +295,218 @@ def test_max_depth_protection():
     # Verify all chunks are within reasonable size
     for ch in split_chunks:
         assert len(ch.content) > 0
+
+
+def test_estimate_tokens_reuses_cached_encoder():
+    """The tiktoken encoder lookup happens once per model, not per call."""
+    from docs_chunker.chunk import _count_tokens, _get_encoder
+
+    _count_tokens.cache_clear()
+    _get_encoder.cache_clear()
+    estimate_tokens("first call")
+    estimate_tokens("second call")
+    info = _get_encoder.cache_info()
+    assert info.misses == 1
+    assert info.hits >= 1
+
+
+def test_estimate_tokens_memoizes_repeated_text():
+    from docs_chunker.chunk import _count_tokens
+
+    _count_tokens.cache_clear()
+    text = "repeated chunk content " * 10
+    first = estimate_tokens(text)
+    assert estimate_tokens(text) == first
+    assert _count_tokens.cache_info().hits == 1
+
+
+def test_chunk_token_count_computed_once_from_content():
+    from docs_chunker.chunk import Chunk
+
+    chunk = Chunk(id=1, title="T", level=1, content="word " * 40)
+    assert chunk.token_count == estimate_tokens(chunk.content)
+    # Token count is derived data and doesn't affect equality
+    other = Chunk(id=1, title="T", level=1, content="word " * 40, token_count=7)
+    assert chunk == other
+
+
+def test_parse_heading_matches_heading_regex():
+    from docs_chunker.chunk import HEADING_RE, _parse_heading
+
+    lines = [
+        "# Title\n",
+        "###\tDeep  \n",
+        "####### seven\n",
+        "#nospace\n",
+        "#\n",
+        "## \n",
+        "plain text\n",
+    ]
+    for line in lines:
+        m = HEADING_RE.match(line)
+        expected = (len(m.group(1)), m.group(2).strip()) if m else None
+        assert _parse_heading(line) == expected
+
+
+def test_estimate_tokens_upper_bound_short_circuits_small_text(monkeypatch):
+    from docs_chunker import chunk as chunk_mod
+
+    def fail(*_args):
+        raise AssertionError("encoder should not be consulted")
+
+    monkeypatch.setattr(chunk_mod, "_count_tokens", fail)
+    text = "short paragraph"
+    assert estimate_tokens(text, upper_bound=100) <= 100
+    # Multi-byte text is bounded by its UTF-8 length, not its char count
+    with pytest.raises(AssertionError):
+        estimate_tokens("ש" * 60, upper_bound=100)
+
+
+def test_chunk_module_exports_resolve_to_single_module():
+    import importlib
+
+    from docs_chunker import chunk as chunk_mod
+
+    assert importlib.import_module("docs_chunker.chunk") is chunk_mod
+    for name in chunk_mod.__all__:
+        assert hasattr(chunk_mod, name)
+    assert chunk_markdown is chunk_mod.chunk_markdown
+
+
+def test_estimate_tokens_batch_uses_single_encoder_call(monkeypatch):
+    from docs_chunker import chunk as chunk_mod
+    from docs_chunker.chunk import estimate_tokens_batch
+
+    calls = []
+
+    class FakeEncoder:
+        def encode_ordinary_batch(self, texts):
+            calls.append(list(texts))
+            return [t.split() for t in texts]
+
+    monkeypatch.setattr(chunk_mod, "_get_encoder", lambda model: FakeEncoder())
+    assert estimate_tokens_batch(["one two", "three", ""]) == [2, 1, 1]
+    assert len(calls) == 1
+
+
+def test_estimate_tokens_batch_matches_single_estimates():
+    from docs_chunker.chunk import estimate_tokens_batch
+
+    texts = ["alpha beta", "פסקה בעברית " * 5, "x"]
+    assert estimate_tokens_batch(texts) == [estimate_tokens(t) for t in texts]
+
+
+def test_split_paragraphs_fast_path_matches_regex_separators():
+    from docs_chunker.chunk import _split_paragraphs
+
+    assert _split_paragraphs("one\n\ntwo\n\n") == [("one", "\n\n"), ("two", "\n\n")]
+    # Wider breaks keep their exact whitespace
+    assert _split_paragraphs("one\n \ntwo\n\n\nthree") == [
+        ("one", "\n \n"),
+        ("two", "\n\n\n"),
+        ("three", ""),
+    ]
+    assert _split_paragraphs("no breaks here\n") == []
+
+
+def test_extract_title_only_scans_leading_lines():
+    from docs_chunker.chunk import _extract_title_from_content
+
+    long_tail = "".join(f"line {i}\n" for i in range(10_000))
+    assert _extract_title_from_content("\n" * 9 + "Short intro\n" + long_tail) == (
+        "Short intro"
+    )
+    # An eleventh line is never used as the title
+    assert _extract_title_from_content("\n" * 10 + "Too late\n", "Fallback") == (
+        "Fallback"
+    )
+
+
+def test_chunk_uses_slots_and_still_copies():
+    import copy
+    import pickle
+
+    from docs_chunker.chunk import Chunk
+
+    chunk = Chunk(id=1, title="T", level=1, content="# T\nbody\n")
+    assert not hasattr(chunk, "__dict__")
+    for clone in (copy.copy(chunk), pickle.loads(pickle.dumps(chunk))):
+        assert clone == chunk
+        assert clone.token_count == chunk.token_count
+
+
+def test_chunk_markdown_batch_matches_per_document_chunking():
+    from docs_chunker.chunk import chunk_markdown_batch
+
+    texts = [SAMPLE_MD, "", "plain text only", "# A\nbody\n## B\nmore\n"] * 2
+    expected = [chunk_markdown(t, min_tokens=1, max_tokens=50) for t in texts]
+    for workers in (1, 2):
+        assert (
+            chunk_markdown_batch(texts, min_tokens=1, max_tokens=50, workers=workers)
+            == expected
+        )
+    assert chunk_markdown_batch([]) == []
+
+
+def test_chunk_markdown_batch_validates_limits_eagerly():
+    from docs_chunker.chunk import chunk_markdown_batch
+
+    with pytest.raises(ValueError, match="min_tokens"):
+        chunk_markdown_batch([], min_tokens=0)
+    with pytest.raises(ValueError, match="max_tokens"):
+        chunk_markdown_batch(["text"], min_tokens=10, max_tokens=5)
+
+
+def test_merging_heading_chunks_sums_token_counts(monkeypatch):
+    from docs_chunker import chunk as chunk_mod
+
+    encoded: list[str] = []
+
+    class FakeEncoder:
+        def encode_ordinary(self, text):
+            encoded.append(text)
+            return text.split()
+
+    monkeypatch.setattr(chunk_mod, "_get_encoder", lambda model: FakeEncoder())
+    md = "".join(f"## Merge sum {i}\nword {i}\n" for i in range(6))
+    chunks = chunk_markdown(md, min_tokens=100, max_tokens=1000)
+    assert [c.content for c in chunks] == [md]
+    assert chunks[0].token_count == len(md.split())
+    # Only the sections themselves were tokenized, never a merged prefix
+    assert sum(map(len, encoded)) == len(md)
+
+
+def test_boundary_chunks_are_counted_in_batches(monkeypatch):
+    from docs_chunker import chunk as chunk_mod
+
+    batches: list[int] = []
+
+    class FakeEncoder:
+        def encode_ordinary(self, text):
+            return text.split()
+
+        def encode_ordinary_batch(self, texts):
+            batches.append(len(texts))
+            return [t.split() for t in texts]
+
+    monkeypatch.setattr(chunk_mod, "_get_encoder", lambda model: FakeEncoder())
+    md = "".join(f"## Batch {i}\nsome words {i}\n" for i in range(150))
+    chunks = chunk_markdown(md, min_tokens=1, max_tokens=1000)
+    assert len(chunks) == 150
+    assert all(c.token_count == len(c.content.split()) for c in chunks)
+    assert batches == [64, 64, 22]
+
+
+def test_bold_split_point_after_numbered_item_with_trailing_space():
+    from docs_chunker.chunk import Chunk, _split_once
+
+    # The numbered item's trailing whitespace must not swallow the bold
+    # heading's line start on the next line
+    content = "1. \n  **b** x\n" + "word " * 40
+    chunk = Chunk(id=1, title="T", level=1, content=content)
+    parts = _split_once(chunk, max_tokens=5, depth_exceeded=False)
+    assert parts is not None
+    assert [part.content for part, _, _ in parts] == [
+        "1. \n",
+        "  **b** x\n" + "word " * 40,
+    ]
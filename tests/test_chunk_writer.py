@@ -32,3 +32,31 @@ def test_save_chunks_creates_files_with_front_matter(tmp_path):
     assert meta["token_count"] > 0
     assert len(meta["checksum"]) == 64
     assert body.lstrip().startswith("# ")
+
+
+def test_front_matter_matches_yaml_dump():
+    from docs_chunker.writer import _front_matter
+
+    digest = "ab" * 32
+    titles = ["Introduction", "סעיף 1", "true", "Risk: high", "", "x" * 90, "a  b"]
+    for title in titles:
+        ch = Chunk(id=3, title=title, level=2, content="text", token_count=7)
+        meta = {
+            "id": 3,
+            "title": title,
+            "level": 2,
+            "token_count": 7,
+            "checksum": digest,
+        }
+        expected = yaml.safe_dump(meta, allow_unicode=True, sort_keys=True)
+        assert _front_matter(ch, digest) == f"---\n{expected}---\n"
+
+
+def test_front_matter_round_trips_unusual_titles():
+    from docs_chunker.writer import _front_matter
+
+    for title in ['Quote "x" & [y]', "emoji 😀 title", "tab\tand break", "1.5"]:
+        ch = Chunk(id=1, title=title, level=1, content="text", token_count=2)
+        front = _front_matter(ch, "cd" * 32)
+        assert front.startswith("---\n") and front.endswith("---\n")
+        assert yaml.safe_load(front[4:-4])["title"] == title
@@ -1,5 +1,7 @@
+import multiprocessing
 from types import SimpleNamespace
 
+import pytest
 from typer.testing import CliRunner
 
 from docs_chunker.cli import app
@@ -63,3 +65,161 @@ def test_cli_invalid_tokens(monkeypatch, tmp_path):
     )
     assert result.exit_code == 1
     assert "max_tokens" in result.output and "min_tokens" in result.output
+
+
+def _write_docs(tmp_path, count):
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    for i in range(count):
+        (docs_dir / f"doc{i}.docx").write_bytes(b"fake")
+    return docs_dir
+
+
+def test_cli_directory_serial_with_single_worker(monkeypatch, tmp_path):
+    from docs_chunker import convert as convert_mod
+    from docs_chunker.io import output_paths_for
+
+    monkeypatch.setattr(convert_mod, "MarkItDown", FakeMarkItDown)
+    docs_dir = _write_docs(tmp_path, 3)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app, [str(docs_dir), "--force", "--min-tokens", "1", "--workers", "1"]
+    )
+    assert result.exit_code == 0, result.output
+    for doc in docs_dir.glob("*.docx"):
+        out_base, chunks_dir = output_paths_for(doc)
+        assert (out_base / f"{doc.stem}.md").exists()
+        assert list(chunks_dir.glob("*.md"))
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="worker processes only inherit the monkeypatched converter under fork",
+)
+def test_cli_directory_uses_worker_processes(monkeypatch, tmp_path):
+    from docs_chunker import convert as convert_mod
+    from docs_chunker.io import output_paths_for
+
+    monkeypatch.setattr(convert_mod, "MarkItDown", FakeMarkItDown)
+    docs_dir = _write_docs(tmp_path, 3)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app, [str(docs_dir), "--force", "--min-tokens", "1", "--workers", "2"]
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output.count("Wrote:") == 3
+    for doc in docs_dir.glob("*.docx"):
+        out_base, _ = output_paths_for(doc)
+        assert (out_base / f"{doc.stem}.md").exists()
+
+
+def test_cli_directory_with_llm_stage_defaults_to_serial(monkeypatch, tmp_path):
+    from docs_chunker import cli as cli_mod
+    from docs_chunker import convert as convert_mod
+    from docs_chunker import llm as llm_mod
+
+    class NoPool:
+        def __init__(self, *args, **kwargs):
+            raise AssertionError("LLM runs must not start worker processes")
+
+    monkeypatch.setattr(convert_mod, "MarkItDown", FakeMarkItDown)
+    monkeypatch.setattr(cli_mod, "ProcessPoolExecutor", NoPool)
+    monkeypatch.setattr(cli_mod.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(
+        llm_mod, "validate_and_adjust_chunks", lambda md, chunks, *a, **k: chunks
+    )
+    docs_dir = _write_docs(tmp_path, 3)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [str(docs_dir), "--force", "--min-tokens", "1", "--llm-validate"],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output.count("LLM validation:") == 3
+
+
+def test_cli_directory_prints_results_in_target_order(monkeypatch, tmp_path):
+    import threading
+    import time
+    from concurrent.futures import Future
+
+    from docs_chunker import cli as cli_mod
+
+    class ReversedPool:
+        """Finish jobs last-submitted first, once every job is queued."""
+
+        def __init__(self, max_workers):
+            self.jobs = []
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def submit(self, fn, *args):
+            future = Future()
+            self.jobs.append((future, fn, args))
+            if len(self.jobs) == 3:
+                threading.Thread(target=self._finish).start()
+            return future
+
+        def _finish(self):
+            time.sleep(0.05)
+            for future, fn, args in reversed(self.jobs):
+                future.set_result(fn(*args))
+                time.sleep(0.01)
+
+    monkeypatch.setattr(cli_mod, "ProcessPoolExecutor", ReversedPool)
+    monkeypatch.setattr(
+        cli_mod, "_process_one", lambda target, opts: [f"done {target.name}"]
+    )
+    docs_dir = _write_docs(tmp_path, 3)
+
+    runner = CliRunner()
+    result = runner.invoke(app, [str(docs_dir), "--workers", "3"])
+    assert result.exit_code == 0, result.output
+    lines = [line for line in result.output.splitlines() if line.startswith("done")]
+    assert lines == ["done doc0.docx", "done doc1.docx", "done doc2.docx"]
+
+
+def test_cli_serial_pipeline_continues_after_failure(monkeypatch, tmp_path):
+    from docs_chunker import convert as convert_mod
+
+    class FlakyMarkItDown(FakeMarkItDown):
+        def convert(self, path: str):
+            if path.endswith("doc1.docx"):
+                raise OSError("corrupt archive")
+            return super().convert(path)
+
+    monkeypatch.setattr(convert_mod, "MarkItDown", FlakyMarkItDown)
+    docs_dir = _write_docs(tmp_path, 3)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [str(docs_dir), "--force", "--min-tokens", "1", "--workers", "1", "--no-cache"],
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output.count("Wrote:") == 2
+    assert result.output.count("Chunks:") == 2
+    assert "Conversion failed" in result.output and "doc1.docx" in result.output
+
+
+def test_cli_import_defers_converter_and_llm_modules():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, docs_chunker.cli; "
+        "print(sorted(m for m in ('docs_chunker.convert', 'docs_chunker.llm', "
+        "'markitdown') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
@@ -0,0 +1,35 @@
+import dataclasses
+
+import pytest
+
+from docs_chunker.config import Settings
+
+
+def test_from_env_reads_overrides(monkeypatch):
+    monkeypatch.setenv("DOCS_CHUNKER_LANGUAGE", "he")
+    monkeypatch.setenv("DOCS_CHUNKER_MIN_TOKENS", "50")
+    monkeypatch.setenv("DOCS_CHUNKER_LLM_VALIDATE", "yes")
+    monkeypatch.setenv("DOCS_CHUNKER_LLM_CACHE", "off")
+
+    s = Settings.from_env()
+    assert s.language == "he"
+    assert s.min_tokens == 50
+    assert s.llm_validation_enabled is True
+    assert s.llm_cache_enabled is False
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        s.min_tokens = 1  # type: ignore[misc]
+
+
+@pytest.mark.parametrize(
+    "var,value",
+    [
+        ("DOCS_CHUNKER_LANGUAGE", "fr"),
+        ("DOCS_CHUNKER_LLM_PROVIDER", "anthropic"),
+        ("DOCS_CHUNKER_MIN_TOKENS", "0"),
+        ("DOCS_CHUNKER_MAX_TOKENS", "10"),
+    ],
+)
+def test_from_env_rejects_invalid_values(monkeypatch, var, value):
+    monkeypatch.setenv(var, value)
+    with pytest.raises(ValueError):
+        Settings.from_env()
@@ -1,24 +1,10 @@
-from types import SimpleNamespace
-
 from docs_chunker.cli import app
 from docs_chunker.convert import convert_docx_to_markdown
 from docs_chunker.io import doc_name_from_path, output_paths_for
 
 
-class FakeMarkItDown:
-    def convert(self, path: str):
-        # Simulate a simple conversion with Hebrew and English, headings preserved
-        text = (
-            """# כותרת ראשית\n\n## Section 1\nParagraph EN.\n\n## סעיף 2\nפסקה HE.\n"""
-        )
-        return SimpleNamespace(text_content=text)
-
-
-def test_convert_docx_to_markdown_monkeypatch(monkeypatch, tmp_path):
-    # Arrange: fake markitdown and fake input path
-    from docs_chunker import convert as convert_mod
-
-    monkeypatch.setattr(convert_mod, "MarkItDown", FakeMarkItDown)
+def test_convert_docx_to_markdown_monkeypatch(patched_convert, tmp_path):
+    # Arrange: fake markitdown (fixture) and fake input path
     fake_input = tmp_path / "sample.docx"
     fake_input.write_bytes(b"fake docx bytes")
 
@@ -32,19 +18,13 @@ def test_convert_docx_to_markdown_monkeypatch(monkeypatch, tmp_path):
     assert md.endswith("\n")
 
 
-def test_cli_writes_expected_output(monkeypatch, tmp_path):
+def test_cli_writes_expected_output(patched_convert, cli_runner, tmp_path):
     # Arrange
-    from typer.testing import CliRunner
-
-    from docs_chunker import convert as convert_mod
-
-    monkeypatch.setattr(convert_mod, "MarkItDown", FakeMarkItDown)
     input_doc = tmp_path / "example.docx"
     input_doc.write_bytes(b"fake")
 
     # Act
-    runner = CliRunner()
-    result = runner.invoke(app, [str(input_doc)])
+    result = cli_runner.invoke(app, [str(input_doc)])
     assert result.exit_code == 0, result.output
 
     # Assert output path exists
@@ -67,14 +47,12 @@ def test_convert_file_not_found(monkeypatch, tmp_path):
         convert_docx_to_markdown(non_existent)
 
 
-def test_convert_invalid_file_format(monkeypatch, tmp_path):
+def test_convert_invalid_file_format(patched_convert, tmp_path):
     """Test handling of non-DOCX files."""
     import pytest
 
-    from docs_chunker import convert as convert_mod
     from docs_chunker.convert import convert_docx_to_markdown
 
-    monkeypatch.setattr(convert_mod, "MarkItDown", FakeMarkItDown)
     txt_file = tmp_path / "example.txt"
     txt_file.write_text("Not a docx file")
 
@@ -95,3 +73,62 @@ def test_convert_markitdown_unavailable(monkeypatch, tmp_path):
 
     with pytest.raises(RuntimeError, match="markitdown is not available"):
         convert_docx_to_markdown(docx_file)
+
+
+def test_convert_caches_by_content_and_converter(
+    monkeypatch, counting_convert, fake_markitdown_cls, tmp_path
+):
+    from docs_chunker import convert as convert_mod
+
+    calls = counting_convert.calls
+    cache_dir = tmp_path / "cache"
+    first = tmp_path / "first.docx"
+    first.write_bytes(b"same bytes")
+    copy = tmp_path / "copy.docx"
+    copy.write_bytes(b"same bytes")
+
+    md = convert_docx_to_markdown(first, cache_dir=cache_dir)
+    # Identical bytes hit the cache regardless of file name
+    assert convert_docx_to_markdown(copy, cache_dir=cache_dir) == md
+    assert len(calls) == 1
+
+    # Changed content misses
+    first.write_bytes(b"new bytes")
+    convert_docx_to_markdown(first, cache_dir=cache_dir)
+    assert len(calls) == 2
+
+    # A different converter doesn't reuse entries
+    monkeypatch.setattr(convert_mod, "MarkItDown", fake_markitdown_cls)
+    assert "Section 1" in convert_docx_to_markdown(copy, cache_dir=cache_dir)
+
+
+def test_cli_no_cache_reconverts(counting_convert, cli_runner, tmp_path):
+    input_doc = tmp_path / "nocache.docx"
+    input_doc.write_bytes(b"no cache bytes")
+
+    for _ in range(2):
+        result = cli_runner.invoke(app, [str(input_doc), "--force", "--no-cache"])
+        assert result.exit_code == 0, result.output
+    assert len(counting_convert.calls) == 2
+
+
+def test_normalize_markdown_strips_trailing_whitespace_per_line():
+    from docs_chunker.convert import _normalize_markdown
+
+    text = "\n  # Title \t\r\nline one   \nkeep\rinner\n\n\ntail  \n\n"
+    assert _normalize_markdown(text) == "# Title\nline one\nkeep\rinner\n\n\ntail\n"
+
+
+def test_normalize_markdown_strips_unicode_trailing_whitespace():
+    from docs_chunker.convert import _normalize_markdown
+
+    assert _normalize_markdown("שלום  \r\nworld ") == "שלום\nworld\n"
+
+
+def test_markitdown_instance_reused_across_conversions(counting_convert, tmp_path):
+    for name in ("a.docx", "b.docx"):
+        doc = tmp_path / name
+        doc.write_bytes(b"fake")
+        assert convert_docx_to_markdown(doc) == counting_convert.markdown
+    assert len(counting_convert.created) == 1
+    assert len(counting_convert.calls) == 2
@@ -1,34 +1,14 @@
 import yaml
-from typer.testing import CliRunner
 
 from docs_chunker.cli import app
 
 
-def test_e2e_docx_to_chunks(monkeypatch, tmp_path):
-    # Mock MarkItDown to return a structured markdown with Hebrew
-    from docs_chunker import convert as convert_mod
-
-    class FakeMarkItDown:
-        def convert(self, path: str):
-            class R:
-                text_content = (
-                    "# כותרת\n\n"
-                    "Intro.\n\n"
-                    "## A\n"
-                    "One.\n\n"
-                    "## סעיף 2\n"
-                    "שתיים.\n"
-                )
-
-            return R()
-
-    monkeypatch.setattr(convert_mod, "MarkItDown", FakeMarkItDown)
-
+def test_e2e_docx_to_chunks(patched_convert, cli_runner, tmp_path):
+    # MarkItDown is mocked (fixture) to return structured markdown with Hebrew
     input_doc = tmp_path / "end2end.docx"
     input_doc.write_bytes(b"fake")
 
-    runner = CliRunner()
-    res = runner.invoke(
+    res = cli_runner.invoke(
         app,
         [
             str(input_doc),
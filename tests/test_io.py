@@ -75,3 +75,122 @@ def test_output_paths_invalid_input(tmp_path):
     base_dir, chunks_dir = output_paths_for(non_existent)
     assert base_dir is not None
     assert chunks_dir is not None
+
+
+def test_output_paths_follow_output_dir_and_cwd_changes(tmp_path, monkeypatch):
+    """Memoized output paths still track the configured output dir and cwd."""
+    from dataclasses import replace
+
+    from docs_chunker import io as io_mod
+
+    file_path = tmp_path / "memo.docx"
+    file_path.write_bytes(b"fake")
+
+    monkeypatch.chdir(tmp_path)
+    base_default, _ = output_paths_for(file_path)
+    assert base_default.parent == tmp_path / "output"
+    assert output_paths_for(file_path) == output_paths_for(file_path)
+
+    custom = replace(io_mod.settings, output_dir=str(tmp_path / "custom"))
+    monkeypatch.setattr(io_mod, "settings", custom)
+    base_custom, _ = output_paths_for(file_path)
+    assert base_custom.parent == tmp_path / "custom"
+    assert base_custom.name == base_default.name
+
+
+def test_write_texts_writes_all_files_and_creates_parents(tmp_path):
+    from docs_chunker.io import write_texts
+
+    items = [
+        (tmp_path / ("a" if i % 2 else "b") / f"{i:03d}.md", f"חלק {i}\n")
+        for i in range(20)
+    ]
+    write_texts(items)
+    for path, content in items:
+        assert path.read_text(encoding="utf-8") == content
+
+
+def test_write_texts_reraises_write_errors(tmp_path):
+    import pytest
+
+    from docs_chunker.io import write_texts
+
+    blocker = tmp_path / "taken"
+    blocker.mkdir()
+    items = [(tmp_path / "ok.md", "ok"), (blocker, "cannot overwrite a directory")]
+    with pytest.raises(OSError, match="taken"):
+        write_texts(items)
+    assert (tmp_path / "ok.md").read_text(encoding="utf-8") == "ok"
+
+
+def test_checksum_variants_agree(tmp_path):
+    from docs_chunker.io import checksum, checksum_bytes, file_checksum
+
+    text = "# כותרת\ncontent\n"
+    path = tmp_path / "doc.md"
+    path.write_bytes(text.encode("utf-8"))
+
+    digest = checksum(text)
+    assert len(digest) == 64
+    assert checksum_bytes(text.encode("utf-8")) == digest
+    assert file_checksum(path) == digest
+    assert checksum(text + " ") != digest
+
+
+def test_iter_docx_matches_glob(tmp_path):
+    from docs_chunker.io import iter_docx
+
+    (tmp_path / "a.docx").write_bytes(b"a")
+    (tmp_path / "b.docx").write_bytes(b"b")
+    (tmp_path / "notes.txt").write_text("skip")
+    (tmp_path / "folder.docx").mkdir()
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "c.docx").write_bytes(b"c")
+
+    found = sorted(iter_docx(tmp_path))
+    assert found == [tmp_path / "a.docx", tmp_path / "b.docx"]
+    assert found == sorted(p for p in tmp_path.glob("*.docx") if p.is_file())
+
+
+def test_write_text_truncates_and_keeps_newlines(tmp_path):
+    from docs_chunker.io import write_text
+
+    path = tmp_path / "out" / "chunk.md"
+    write_text(path, "a much longer first version\n" * 10)
+    write_text(path, "שורה\nline\n")
+    assert path.read_bytes() == "שורה\nline\n".encode()
+
+
+def test_remove_files_deletes_matching_files_only(tmp_path):
+    from docs_chunker.io import remove_files
+
+    (tmp_path / "001_a.md").write_text("a")
+    (tmp_path / ".hidden.md").write_text("h")
+    (tmp_path / "keep.txt").write_text("k")
+    (tmp_path / "dir.md").mkdir()
+
+    remove_files(tmp_path, ".md")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["dir.md", "keep.txt"]
+    remove_files(tmp_path / "missing", ".md")
+
+
+def test_write_texts_leaves_file_mode_to_umask(tmp_path):
+    import os
+    import stat
+    import sys
+
+    import pytest
+
+    from docs_chunker.io import write_texts
+
+    if sys.platform == "win32":
+        pytest.skip("POSIX file modes")
+    previous = os.umask(0o002)
+    try:
+        write_texts([(tmp_path / "group.md", "shared\n")])
+        reference = tmp_path / "reference.md"
+        reference.write_text("shared\n", encoding="utf-8")
+    finally:
+        os.umask(previous)
+    mode = stat.S_IMODE((tmp_path / "group.md").stat().st_mode)
+    assert mode == stat.S_IMODE(reference.stat().st_mode) == 0o664
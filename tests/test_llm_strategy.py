@@ -1,5 +1,4 @@
 import json
-import sys
 import types
 
 import pytest
@@ -10,7 +9,9 @@ from docs_chunker.llm_strategy import (
     _build_strategy_prompt,
     _call_ollama_strategy,
     _can_fit_in_context,
+    _parse_batch_strategy_response,
     _parse_strategy_response,
+    decide_chunking_strategies,
     decide_chunking_strategy,
 )
 from docs_chunker.structure import DocumentStructure, HeadingInfo
@@ -99,6 +100,8 @@ def test_parse_strategy_response_invalid_returns_none():
 
 
 def test_call_ollama_strategy_success(monkeypatch):
+    from docs_chunker import llm_strategy
+
     class DummyClient:
         def __init__(self, host: str):
             self.host = host
@@ -107,38 +110,17 @@ def test_call_ollama_strategy_success(monkeypatch):
             return {"response": '{"strategy": "by_level", "level": 2}'}
 
     dummy_module = types.SimpleNamespace(Client=DummyClient)
-    monkeypatch.setitem(sys.modules, "ollama", dummy_module)
+    monkeypatch.setattr(llm_strategy, "ollama", dummy_module)
 
     response = _call_ollama_strategy("prompt", model="test", base_url="http://example")
     assert '"strategy"' in response
 
-    monkeypatch.delitem(sys.modules, "ollama")
-
 
 def test_call_ollama_strategy_missing_module(monkeypatch):
-    # Remove ollama from sys.modules to prevent it from being found
-    if "ollama" in sys.modules:
-        monkeypatch.delitem(sys.modules, "ollama")
-
-    # Patch importlib.import_module directly
-    # Since importlib is imported inside _call_ollama_strategy, we need to
-    # patch the importlib module that's in sys.modules (which both will use)
-    import importlib
-
-    # Save the original function to avoid recursion
-    original_import_module = importlib.import_module
-
-    def patched_import_module(name, package=None):
-        if name == "ollama":
-            raise ModuleNotFoundError(f"No module named '{name}'")
-        return original_import_module(name, package)
-
-    # Patch importlib.import_module on the module in sys.modules
-    # This will affect the module that gets imported inside the function
-    monkeypatch.setattr(importlib, "import_module", patched_import_module)
+    from docs_chunker import llm_strategy
 
-    # Also ensure sys.modules doesn't have ollama cached
-    monkeypatch.delitem(sys.modules, "ollama", raising=False)
+    # The module-level optional import leaves None when ollama isn't installed
+    monkeypatch.setattr(llm_strategy, "ollama", None)
 
     result = _call_ollama_strategy("prompt")
     assert result is None, f"Expected None but got: {result}"
@@ -198,3 +180,239 @@ def test_chunk_with_llm_strategy_no_strategy(monkeypatch):
     assert structure.has_structure is False or not structure.headings
     assert strategy is None
     assert chunks is None
+
+
+def test_parse_batch_strategy_response_by_index():
+    response = (
+        "Here you go:\n```json\n"
+        + json.dumps(
+            [
+                {"index": 1, "strategy": "by_level", "level": 3},
+                {"index": 0, "strategy": "custom_boundaries", "boundaries": [0, 9]},
+                {"index": 2, "strategy": "by_level", "level": 9},
+                {"index": 7, "strategy": "by_level", "level": 2},
+            ]
+        )
+        + "\n```"
+    )
+    parsed = _parse_batch_strategy_response(response, 3)
+
+    assert parsed[0].strategy_type == "custom_boundaries"
+    assert parsed[0].boundaries == [0, 9]
+    assert parsed[1].level == 3
+    assert parsed[2] is None
+    assert _parse_batch_strategy_response("not json", 2) == [None, None]
+
+
+def test_decide_chunking_strategies_packs_documents(monkeypatch, sample_structure):
+    from docs_chunker import llm_strategy
+
+    prompts = []
+
+    def fake_call(prompt, model, base_url, cache_dir=None):
+        prompts.append(prompt)
+        if "=== Document 0 ===" in prompt:
+            count = prompt.count("=== Document ")
+            # Leave the last document unanswered to exercise the fallback
+            return json.dumps(
+                [
+                    {"index": i, "strategy": "by_level", "level": 2}
+                    for i in range(count - 1)
+                ]
+            )
+        return '{"strategy": "by_level", "level": 1}'
+
+    monkeypatch.setattr(llm_strategy, "_call_ollama_strategy", fake_call)
+    documents = [("# Title\n\nbody\n", sample_structure)] * 5
+    strategies = decide_chunking_strategies(documents, 100, 500, batch_size=4)
+
+    # One packed prompt for four documents, one retry, one lone document
+    assert len(prompts) == 3
+    assert [s.level for s in strategies] == [2, 2, 2, 1, 1]
+
+
+def test_decide_chunking_strategies_runs_requests_concurrently(
+    monkeypatch, sample_structure
+):
+    import threading
+
+    from docs_chunker import llm_strategy
+
+    # Both requests must be in flight at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_call(prompt, model, base_url, cache_dir=None):
+        barrier.wait()
+        return '{"strategy": "by_level", "level": 2}'
+
+    monkeypatch.setattr(llm_strategy, "_call_ollama_strategy", fake_call)
+    documents = [("# Title\n\nbody\n", sample_structure)] * 2
+    strategies = decide_chunking_strategies(
+        documents, 100, 500, batch_size=1, max_concurrency=2
+    )
+    assert [s.level for s in strategies] == [2, 2]
+
+
+def test_can_fit_in_context_skips_tokenizer_for_small_prompts(
+    monkeypatch, sample_structure
+):
+    from docs_chunker import llm_strategy
+
+    def fail(*args, **kwargs):
+        raise AssertionError("tokenizer should not run for an obviously small prompt")
+
+    monkeypatch.setattr(llm_strategy, "estimate_tokens", fail)
+    assert _can_fit_in_context(sample_structure, "# Title\n\nbody\n")
+
+
+def test_parse_strategy_response_ignores_braces_inside_strings():
+    response = (
+        "```json\n"
+        '{"strategy": "by_level", "level": 2, "reasoning": "keep {a} \\"}\\" together"}'
+        "\n```\nNote: {not json}"
+    )
+    strategy = _parse_strategy_response(response)
+    assert strategy is not None
+    assert strategy.level == 2
+    assert strategy.reasoning == 'keep {a} "}" together'
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_parse_strategy_response_with_and_without_orjson(monkeypatch, use_orjson):
+    from docs_chunker import llm_strategy
+
+    if not use_orjson:
+        monkeypatch.setattr(llm_strategy, "orjson", None)
+    elif llm_strategy.orjson is None:
+        pytest.skip("orjson not installed")
+
+    strategy = _parse_strategy_response('{"strategy": "by_level", "level": 4}')
+    assert strategy is not None and strategy.level == 4
+    assert _parse_strategy_response('{"strategy": "by_level", "level": }') is None
+
+
+def test_call_ollama_strategy_caches_responses(monkeypatch, tmp_path):
+    from collections import OrderedDict
+
+    from docs_chunker import llm_strategy
+
+    calls = []
+
+    class DummyClient:
+        def __init__(self, host: str):
+            pass
+
+        def generate(self, **kwargs):
+            calls.append(kwargs["prompt"])
+            return {"response": '{"strategy": "by_level", "level": 2}'}
+
+    dummy_module = types.SimpleNamespace(Client=DummyClient)
+    monkeypatch.setattr(llm_strategy, "ollama", dummy_module)
+    monkeypatch.setattr(llm_strategy, "_response_cache", OrderedDict())
+
+    def call(model="m", cache_dir=tmp_path / "llm"):
+        return _call_ollama_strategy("cached prompt", model=model, cache_dir=cache_dir)
+
+    first = call()
+    assert call() == first
+    assert len(calls) == 1
+
+    # Survives a new process (empty memory cache) through the on-disk entry
+    llm_strategy._response_cache.clear()
+    assert call() == first
+    assert len(calls) == 1
+
+    # Other models and uncached calls go to the model
+    call(model="other")
+    call(cache_dir=None)
+    assert len(calls) == 3
+
+
+def test_call_ollama_strategy_cache_is_per_host(monkeypatch, tmp_path):
+    from collections import OrderedDict
+
+    from docs_chunker import llm_strategy
+
+    class DummyClient:
+        def __init__(self, host: str):
+            self.host = host
+
+        def generate(self, **kwargs):
+            return {"response": f"answer from {self.host}"}
+
+    dummy_module = types.SimpleNamespace(Client=DummyClient)
+    monkeypatch.setattr(llm_strategy, "ollama", dummy_module)
+    monkeypatch.setattr(llm_strategy, "_response_cache", OrderedDict())
+
+    def call(base_url):
+        return _call_ollama_strategy(
+            "shared prompt", model="m", base_url=base_url, cache_dir=tmp_path
+        )
+
+    assert call("http://host-a:11434") == "answer from http://host-a:11434"
+    assert call("http://host-b:11434") == "answer from http://host-b:11434"
+    # Neither in memory nor on disk do the hosts share an entry
+    llm_strategy._response_cache.clear()
+    assert call("http://host-a:11434") == "answer from http://host-a:11434"
+    assert call("http://host-b:11434") == "answer from http://host-b:11434"
+
+
+def test_call_ollama_strategy_reuses_client_per_host(monkeypatch):
+    from docs_chunker import llm_strategy
+
+    created = []
+
+    class DummyClient:
+        def __init__(self, host: str):
+            created.append(host)
+
+        def generate(self, **kwargs):
+            return {"response": "{}"}
+
+    dummy_module = types.SimpleNamespace(Client=DummyClient)
+    monkeypatch.setattr(llm_strategy, "ollama", dummy_module)
+
+    for _ in range(3):
+        _call_ollama_strategy("prompt", base_url="http://a")
+    _call_ollama_strategy("prompt", base_url="http://b")
+    assert created == ["http://a", "http://b"]
+
+
+def test_build_strategy_prompt_is_short_without_headings():
+    structure = DocumentStructure(
+        headings=[],
+        total_tokens=900,
+        total_lines=40,
+        min_level=0,
+        max_level=0,
+        has_structure=False,
+    )
+    prompt = _build_strategy_prompt(structure, "plain text\n" * 40, 200, 400)
+
+    assert "custom_boundaries" in prompt
+    assert "200-400 tokens" in prompt
+    assert "Sample Content" not in prompt
+
+
+def test_decide_chunking_strategy_computes_previews_once(monkeypatch, sample_structure):
+    from docs_chunker import llm_strategy
+
+    preview_calls = []
+    real_previews = llm_strategy.get_section_previews
+
+    def counting_previews(*args, **kwargs):
+        preview_calls.append(args)
+        return real_previews(*args, **kwargs)
+
+    monkeypatch.setattr(llm_strategy, "get_section_previews", counting_previews)
+    monkeypatch.setattr(
+        llm_strategy,
+        "_call_ollama_strategy",
+        lambda *args, **kwargs: '{"strategy": "by_level", "level": 2}',
+    )
+    strategy = decide_chunking_strategy(
+        "# Title\n\nbody\n## Section\nmore\n", sample_structure, 100, 500
+    )
+    assert strategy is not None and strategy.level == 2
+    # The fit check and the prompt share one set of previews
+    assert len(preview_calls) == 1
@@ -1,5 +1,7 @@
 import textwrap
 
+import pytest
+
 from docs_chunker.chunk import chunk_markdown
 from docs_chunker.llm import validate_and_adjust_chunks
 
@@ -20,6 +22,15 @@ SAMPLE_MD = (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_proposal_cache():
+    from docs_chunker import llm as llm_mod
+
+    llm_mod._proposal_cache.clear()
+    yield
+    llm_mod._proposal_cache.clear()
+
+
 def test_validator_identity_when_llm_unavailable(monkeypatch):
     # Force internal proposer to return None (simulate unavailable model)
     from docs_chunker import llm as llm_mod
@@ -41,14 +52,240 @@ def test_validator_applies_merge_plan(monkeypatch):
 
     chunks = chunk_markdown(SAMPLE_MD, min_tokens=1, max_tokens=100)
 
-    # Plan: merge last two chunks
+    # Plan: merge last two chunks (max_tokens=2 leaves the first chunk oversized,
+    # so the LLM is consulted)
     def fake_propose(markdown_text, chunks_schema, **kwargs):
         return {
             "operations": [{"type": "merge", "range": [len(chunks) - 1, len(chunks)]}]
         }
 
     monkeypatch.setattr(llm_mod, "_llm_propose_boundaries", fake_propose)
-    adjusted = validate_and_adjust_chunks(SAMPLE_MD, chunks, 1, 100, language_hint="en")
+    adjusted = validate_and_adjust_chunks(SAMPLE_MD, chunks, 1, 2, language_hint="en")
 
     assert "".join(c.content for c in adjusted).strip() == SAMPLE_MD.strip()
     assert len(adjusted) == len(chunks) - 1
+
+
+def test_covers_matches_join_and_strip_comparison():
+    import random
+
+    from docs_chunker.chunk import Chunk
+    from docs_chunker.llm import _covers
+
+    rng = random.Random(0)
+    alphabet = ["a", "ב", " ", "\n", "\t", " ", "#"]
+    for _ in range(500):
+        parts = ["".join(rng.choices(alphabet, k=rng.randint(0, 6))) for _ in range(4)]
+        chunks = [Chunk(id=1, title="", level=1, content=p) for p in parts]
+        text = "".join(parts)
+        if rng.random() < 0.5:
+            text = "".join(rng.choices(alphabet, k=len(text)))
+        expected = "".join(parts).strip() == text.strip()
+        assert _covers(text, chunks) is expected, (parts, text)
+
+
+def test_validator_reuses_chunk_token_counts(monkeypatch):
+    from docs_chunker import chunk as chunk_mod
+    from docs_chunker import llm as llm_mod
+
+    chunks = chunk_markdown(SAMPLE_MD, min_tokens=1, max_tokens=100)
+    calls = []
+    monkeypatch.setattr(
+        chunk_mod, "estimate_tokens", lambda text, *a, **k: calls.append(text) or 1
+    )
+    monkeypatch.setattr(
+        llm_mod, "_llm_propose_boundaries", lambda *a, **k: {"operations": []}
+    )
+
+    adjusted = validate_and_adjust_chunks(SAMPLE_MD, chunks, 1, 100)
+    assert len(adjusted) == len(chunks)
+    assert calls == []
+
+
+def test_validator_caches_proposals(monkeypatch, tmp_path):
+    from docs_chunker import llm as llm_mod
+
+    chunks = chunk_markdown(SAMPLE_MD, min_tokens=1, max_tokens=100)
+    calls = []
+
+    def fake_propose(markdown_text, chunks_schema, **kwargs):
+        calls.append(kwargs)
+        return {"operations": [{"type": "merge", "range": [1, 2]}]}
+
+    monkeypatch.setattr(llm_mod, "_llm_propose_boundaries", fake_propose)
+    cache_dir = tmp_path / "llm"
+
+    first = validate_and_adjust_chunks(SAMPLE_MD, chunks, 1, 2, cache_dir=cache_dir)
+    again = validate_and_adjust_chunks(SAMPLE_MD, chunks, 1, 2, cache_dir=cache_dir)
+    assert len(calls) == 1
+    assert [c.content for c in again] == [c.content for c in first]
+
+    # A fresh process (empty memory cache) still reuses the on-disk entry
+    llm_mod._proposal_cache.clear()
+    validate_and_adjust_chunks(SAMPLE_MD, chunks, 1, 2, cache_dir=cache_dir)
+    assert len(calls) == 1
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    # Different settings or caching disabled go back to the LLM
+    validate_and_adjust_chunks(SAMPLE_MD, chunks, 1, 1, cache_dir=cache_dir)
+    validate_and_adjust_chunks(SAMPLE_MD, chunks, 1, 2, cache=False)
+    assert len(calls) == 3
+
+
+def test_apply_operations_chained_merges():
+    from docs_chunker.chunk import Chunk
+    from docs_chunker.llm import _apply_operations
+
+    parts = [f"## S{i}\nbody {i}\n\n" for i in range(5)]
+    chunks = [
+        Chunk(id=i, title=f"S{i}", level=2, content=p)
+        for i, p in enumerate(parts, start=1)
+    ]
+    plan = {
+        "operations": [
+            {"type": "merge", "range": [1, 2]},
+            {"type": "merge", "range": [1, 3]},
+            {"type": "merge", "range": [9, 12]},
+        ]
+    }
+    result = _apply_operations("".join(parts), chunks, plan)
+
+    assert [c.content for c in result] == ["".join(parts[:4]), parts[4]]
+    assert [(c.id, c.title) for c in result] == [(1, "S1"), (2, "S5")]
+    assert result[0].token_count > chunks[0].token_count
+    assert [c.id for c in chunks] == [1, 2, 3, 4, 5]
+
+
+def test_validator_batch_sends_uncached_documents_together(monkeypatch):
+    from docs_chunker import llm as llm_mod
+
+    other_md = SAMPLE_MD.replace("two", "three")
+    documents = [
+        (md, chunk_markdown(md, min_tokens=1, max_tokens=100))
+        for md in (SAMPLE_MD, other_md)
+    ]
+    last = len(documents[0][1])
+    merge_last = {"operations": [{"type": "merge", "range": [last - 1, last]}]}
+    batches = []
+
+    def fake_batch(docs, **kwargs):
+        batches.append([md for md, _ in docs])
+        return [merge_last, None]
+
+    def fake_single(*args, **kwargs):
+        raise AssertionError("batched documents should not be proposed one by one")
+
+    monkeypatch.setattr(llm_mod, "_llm_propose_boundaries_batch", fake_batch)
+    monkeypatch.setattr(llm_mod, "_llm_propose_boundaries", fake_single)
+    results = llm_mod.validate_and_adjust_chunks_batch(documents, 1, 2)
+
+    assert batches == [[SAMPLE_MD, other_md]]
+    assert len(results[0]) == last - 1
+    assert results[1] == documents[1][1]
+
+
+def test_validator_skips_llm_when_chunks_within_bounds(monkeypatch):
+    from docs_chunker import llm as llm_mod
+
+    def fail(*args, **kwargs):
+        raise AssertionError("in-bounds chunks should not be sent to the LLM")
+
+    monkeypatch.setattr(llm_mod, "_llm_propose_boundaries", fail)
+    monkeypatch.setattr(llm_mod, "_llm_propose_boundaries_batch", fail)
+    chunks = chunk_markdown(SAMPLE_MD, min_tokens=1, max_tokens=100)
+
+    assert validate_and_adjust_chunks(SAMPLE_MD, chunks, 1, 100) == chunks
+    documents = [(SAMPLE_MD, chunks), (SAMPLE_MD, chunks)]
+    assert llm_mod.validate_and_adjust_chunks_batch(documents, 1, 100) == [
+        chunks,
+        chunks,
+    ]
+
+
+def test_softening_groups_match_pairwise_merging():
+    import random
+
+    from docs_chunker.chunk import Chunk
+    from docs_chunker.llm import _adjust_with_proposal
+
+    def pairwise(chunks, min_tokens):
+        result = []
+        for ch in chunks:
+            if result and result[-1].token_count < min_tokens:
+                prev = result[-1]
+                result[-1] = Chunk(
+                    id=prev.id,
+                    title=prev.title or ch.title,
+                    level=min(prev.level, ch.level),
+                    content=prev.content + ch.content,
+                )
+            else:
+                result.append(ch)
+        return result
+
+    rng = random.Random(3)
+    for _ in range(200):
+        chunks = [
+            Chunk(
+                id=i,
+                title=rng.choice(["", f"T{i}"]),
+                level=rng.randint(1, 3),
+                content="word " * rng.randint(1, 30) + "\n\n",
+            )
+            for i in range(1, rng.randint(2, 12))
+        ]
+        text = "".join(c.content for c in chunks)
+        min_tokens = rng.randint(1, 20)
+        got = _adjust_with_proposal(text, chunks, {"operations": []}, min_tokens)
+        expected = pairwise(chunks, min_tokens)
+        assert [(c.title, c.level, c.content) for c in got] == [
+            (c.title, c.level, c.content) for c in expected
+        ]
+
+
+
+@pytest.fixture
+def byte_encoder(monkeypatch):
+    """Tokenizer counting one token per UTF-8 byte; yields the texts it encoded."""
+    from docs_chunker import chunk as chunk_mod
+
+    encoded: list[str] = []
+
+    class ByteEncoder:
+        def encode_ordinary(self, text):
+            encoded.append(text)
+            return list(text.encode("utf-8"))
+
+    chunk_mod._count_tokens.cache_clear()
+    monkeypatch.setattr(chunk_mod, "_get_encoder", lambda model: ByteEncoder())
+    yield encoded
+    chunk_mod._count_tokens.cache_clear()
+
+
+def test_softening_keeps_group_reaching_min_tokens_exactly(byte_encoder):
+    from docs_chunker.chunk import Chunk
+    from docs_chunker.llm import _adjust_with_proposal
+
+    chunks = [
+        Chunk(id=i, title="", level=1, content=content)
+        for i, content in enumerate(["aaa", "bb", "cccccccc"], start=1)
+    ]
+    got = _adjust_with_proposal("aaabbcccccccc", chunks, {"operations": []}, 5)
+    assert [c.content for c in got] == ["aaabb", "cccccccc"]
+
+
+def test_softening_sums_counts_of_heading_led_chunks(byte_encoder):
+    from docs_chunker.chunk import Chunk
+    from docs_chunker.llm import _adjust_with_proposal
+
+    contents = [f"# Soft {i}\nbody\n" for i in range(5)]
+    chunks = [
+        Chunk(id=i, title=f"Soft {i}", level=1, content=content)
+        for i, content in enumerate(contents, start=1)
+    ]
+    md = "".join(contents)
+    got = _adjust_with_proposal(md, chunks, {"operations": []}, len(md))
+    assert [c.content for c in got] == [md]
+    # The running count never re-encodes a partial group; only the chunks and
+    # the final merged chunk are tokenized
+    assert byte_encoder == [*contents, md]
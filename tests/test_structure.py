@@ -102,3 +102,97 @@ def test_section_preview_invalid_max_chars():
 @pytest.mark.skip(reason="Requires real document fixture")
 def test_real_document_structure():
     assert True
+
+
+def test_get_section_previews_matches_single_previews():
+    from docs_chunker.structure import get_section_previews
+
+    md = "# A\nalpha text\n\n## B\nbeta text\n\n# C\ngamma\n"
+    structure = extract_structure(md)
+    previews = get_section_previews(md, structure.headings, max_chars=12)
+
+    assert previews == [
+        get_section_preview(md, h, max_chars=12) for h in structure.headings
+    ]
+    assert previews[2] == "# C\ngamma"
+
+
+def test_section_preview_of_long_section_truncates_once():
+    md = "# Big\n\n" + "".join(f"line {i} text\n" for i in range(5000)) + "   \n"
+    structure = extract_structure(md)
+    preview = get_section_preview(md, structure.headings[0], max_chars=20)
+    assert preview == "# Big\n\nline 0 text\nl…"
+
+
+def test_section_ends_follow_heading_levels():
+    from docs_chunker.chunk import estimate_tokens
+
+    md = "# A\n## B\ntext\n### C\nmore\n## D\n# E\ntail\n"
+    lines = md.splitlines(keepends=True)
+    structure = extract_structure(md)
+    spans = [(h.title, h.section_start, h.section_end) for h in structure.headings]
+    assert spans == [("A", 0, 6), ("B", 1, 5), ("C", 3, 5), ("D", 5, 6), ("E", 6, 8)]
+    for h in structure.headings:
+        section = "".join(lines[h.section_start : h.section_end])
+        assert h.token_count == estimate_tokens(section)
+
+
+def test_section_token_counts_tokenize_each_line_once(monkeypatch):
+    from docs_chunker import chunk as chunk_mod
+    from docs_chunker import structure as structure_mod
+
+    encoded: list[str] = []
+
+    class FakeEncoder:
+        def encode_ordinary(self, text):
+            encoded.append(text)
+            return text.split()
+
+        def encode_ordinary_batch(self, texts):
+            return [self.encode_ordinary(text) for text in texts]
+
+    encoder = FakeEncoder()
+    monkeypatch.setattr(chunk_mod, "_get_encoder", lambda model: encoder)
+    monkeypatch.setattr(structure_mod, "_get_encoder", lambda model: encoder)
+
+    md = "lead\n# A\nintro words\n## B\none two three\n### C\nfour\n## D\nfive six\n"
+    lines = md.splitlines(keepends=True)
+    structure = extract_structure(md)
+    # Each line is encoded once, including for the document total
+    assert sum(len(text) for text in encoded) == len(md)
+    assert structure.total_tokens == len(md.split())
+    for h in structure.headings:
+        section = "".join(lines[h.section_start : h.section_end])
+        assert h.token_count == len(section.split())
+
+
+def test_structure_uses_slots_and_still_pickles():
+    import pickle
+
+    structure = extract_structure("# T\nbody\n## S\nmore\n")
+    assert not hasattr(structure, "__dict__")
+    assert not hasattr(structure.headings[0], "__dict__")
+    assert pickle.loads(pickle.dumps(structure)) == structure
+
+
+@pytest.mark.parametrize("md", ["", "one", "a\nb\n", "a\r\nb\rc", "a b\n\n"])
+def test_headingless_structure_counts_lines_like_splitlines(md):
+    structure = extract_structure(md)
+    assert structure.has_structure is False
+    assert structure.total_lines == len(md.splitlines())
+
+
+def test_section_previews_from_char_spans_match_line_spans():
+    from dataclasses import replace
+
+    from docs_chunker.structure import get_section_previews
+
+    md = "# A\n\n  alpha text  \n\n## B\r\n   \n# C\n" + "gamma " * 80
+    structure = extract_structure(md)
+    for h in structure.headings:
+        assert md[h.char_start : h.char_end].startswith("#")
+    line_only = [replace(h, char_start=-1, char_end=-1) for h in structure.headings]
+    for max_chars in (0, 3, 12, 300):
+        assert get_section_previews(
+            md, structure.headings, max_chars
+        ) == get_section_previews(md, line_only, max_chars)